@@ -7,7 +7,7 @@ caching, and preloading across all ftrack_inout plugins (browser, Asset Watcher,
 
 from .cache_wrapper import MemoryCacheWrapper, LoggingCacheWrapper, create_optimized_cache
 from .cache_preloader import CachePreloader, create_preloader
-from .session_factory import create_shared_session, get_shared_session
+from .session_factory import create_shared_session, create_worker_session, get_shared_session
 from .path_from_project import (
     get_asset_display_path,
     get_component_display_path,
@@ -25,6 +25,7 @@ __all__ = [
     'CachePreloader',
     'create_preloader',
     'create_shared_session',
+    'create_worker_session',
     'get_shared_session',
     'get_asset_display_path',
     'get_component_display_path',
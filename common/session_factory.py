@@ -344,6 +344,40 @@ def create_shared_session(
         return None
 
 
+def create_worker_session(enable_locations: bool = True) -> Optional["ftrack_api.Session"]:
+    """
+    Create a separate (non-shared) Ftrack session for a worker thread.
+    
+    Sessions are not thread-safe, so threads that talk to the server in
+    parallel each need their own. Uses the same credentials and location
+    setup as the shared session, but not its file cache. The caller closes it.
+    
+    Args:
+        enable_locations: Whether to register multi-site locations (default: True)
+        
+    Returns:
+        Ftrack session instance, or None if creation failed
+    """
+    if not FTRACK_API_AVAILABLE:
+        logger.error("ftrack_api not available - cannot create session")
+        return None
+
+    _load_ftrack_env_early()
+
+    try:
+        session = ftrack_api.Session(auto_connect_event_hub=False)
+    except Exception as e:
+        logger.error("Failed to create worker session: %s", e)
+        return None
+
+    if enable_locations:
+        try:
+            _add_locations_if_available(session)
+        except Exception as e:
+            logger.warning("Multi-site locations bootstrap failed: %s", e)
+    return session
+
+
 def get_shared_session() -> Optional["ftrack_api.Session"]:
     """
     Get the shared Ftrack session, creating it if necessary.
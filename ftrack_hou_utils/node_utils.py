@@ -29,8 +29,19 @@ def set_parm(node, parm_name, value):
             pass
 
 def set_multiple_parms(node, parm_dict):
-    for k, v in parm_dict.items():
-        set_parm(node, k, v)
+    # One node.setParms() call, so dependents see a single change instead of
+    # one per parm. Parms the node lacks are skipped, as in set_parm.
+    if not node:
+        return
+    existing = {k: v for k, v in parm_dict.items() if node.parm(k) is not None}
+    if not existing:
+        return
+    try:
+        node.setParms(existing)
+    except Exception:
+        # A value one parm rejects fails the whole batch; set the rest singly
+        for k, v in existing.items():
+            set_parm(node, k, v)
 
 def copy_parm_templates(source_node, target_node):
     source_group = source_node.parmTemplateGroup()
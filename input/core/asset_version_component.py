@@ -7,7 +7,8 @@ Pure logic - no UI, no DCC. Extracted from Houdini finput build_version_componen
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -156,3 +157,35 @@ def load_asset_version_component_data(
     except Exception as e:
         logger.error("load_asset_version_component_data failed: %s", e, exc_info=True)
         return None
+
+
+# Loaded data per (id(session), asset_id) -> (monotonic stamp, data), so bursts
+# of UI lookups (selection -> preview -> filter) skip the server. Entries
+# expire after _LOAD_CACHE_TTL seconds; force_refresh replaces the entry.
+_LOAD_CACHE_MAX = 128
+_LOAD_CACHE_TTL = 5.0
+_load_cache: Dict[Tuple[int, str], Tuple[float, CachedData]] = {}
+
+
+def load_asset_version_component_data_cached(
+    session: Any,
+    asset_id: str,
+    force_refresh: bool = False,
+) -> Optional[CachedData]:
+    """
+    load_asset_version_component_data, memoized per (session, asset_id) for
+    _LOAD_CACHE_TTL seconds. force_refresh always queries and replaces the entry.
+    """
+    key = (id(session), asset_id)
+    if not force_refresh:
+        entry = _load_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _LOAD_CACHE_TTL:
+            return entry[1]
+    data = load_asset_version_component_data(session, asset_id, force_refresh=force_refresh)
+    if data is None:
+        _load_cache.pop(key, None)
+        return None
+    if key not in _load_cache and len(_load_cache) >= _LOAD_CACHE_MAX:
+        _load_cache.pop(next(iter(_load_cache)))  # oldest first
+    _load_cache[key] = (time.monotonic(), data)
+    return data
@@ -21,6 +21,11 @@ BUILTIN_LOCATION_NAMES = frozenset((
     "ftrack.connect",
 ))
 
+# Built-ins are filtered server-side so they never cross the wire.
+_USER_LOCATIONS_QUERY = "Location where name not_in ({})".format(
+    ", ".join('"{}"'.format(n) for n in sorted(BUILTIN_LOCATION_NAMES))
+)
+
 
 def get_primary_disk_location(session: Any) -> Optional[Any]:
     """
@@ -36,16 +41,13 @@ def get_primary_disk_location(session: Any) -> Optional[Any]:
         return None
     try:
         import ftrack_api
-        locations = session.query("Location").all()
+        locations = session.query(_USER_LOCATIONS_QUERY).all()
     except Exception as e:
         logger.warning("get_primary_disk_location: query failed: %s", e)
         return None
 
     disk_locations = []
     for loc in locations:
-        name = loc.get("name") or ""
-        if name in BUILTIN_LOCATION_NAMES:
-            continue
         acc = getattr(loc, "accessor", None)
         if not acc:
             continue
@@ -59,8 +61,8 @@ def get_primary_disk_location(session: Any) -> Optional[Any]:
 
     # Lower priority value = higher precedence (ftrack convention).
     # priority is an instance attribute (Location.priority), not entity data - use getattr.
-    disk_locations.sort(key=lambda l: getattr(l, "priority", 999))
-    return disk_locations[0]
+    # It cannot be ordered on the server, so pick the minimum client-side (no full sort).
+    return min(disk_locations, key=lambda l: getattr(l, "priority", 999))
 
 
 def resolve_component_path(
@@ -6,13 +6,53 @@ Pure logic - extracted from Houdini _update_version_menu_indicators.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Private key on cached_data holding the normalized indexes (see _get_norm_index)
+_NORM_KEY = "_norm"
 
 
 def _normalize_file_type(ft: str) -> str:
     return (ft or "").replace(".", "").strip().lower()
 
 
+def _get_norm_index(cached_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalized file types / names of cached_data, built once and stored on the dict.
+
+    Label recomputation (every component click) then reuses it instead of
+    re-normalizing the whole asset. A reload produces a new cached_data,
+    which drops the index with it. Not JSON-serializable - dump cached_data
+    before computing labels.
+
+    Returns:
+        {"ft": {version_id: {comp_id: ft_norm}},
+         "by_key": {(name_lower, ft_norm): {version_id, ...}}}
+    """
+    norm = cached_data.get(_NORM_KEY)
+    if norm is not None:
+        return norm
+
+    components_map = cached_data.get("components_map", {})
+    components_file_types = cached_data.get("components_file_types", {})
+    components_names = cached_data.get("components_names", {})
+
+    ft_norm_by_vid: Dict[str, Dict[str, str]] = {}
+    by_key: Dict[Tuple[str, str], Set[str]] = {}
+    for vid, comps in components_map.items():
+        ver_ft = components_file_types.get(vid, {})
+        ver_names = components_names.get(vid, {})
+        ver_ft_norm = ft_norm_by_vid[vid] = {}
+        for cid in comps:
+            ft_norm = ver_ft_norm[cid] = _normalize_file_type(ver_ft.get(cid, ""))
+            name_lower = (ver_names.get(cid, "") or "").strip().lower()
+            by_key.setdefault((name_lower, ft_norm), set()).add(vid)
+
+    norm = {"ft": ft_norm_by_vid, "by_key": by_key}
+    cached_data[_NORM_KEY] = norm
+    return norm
+
+
 def compute_version_labels_with_indicators(
     cached_data: Dict[str, Any],
     selected_comp_id: str,
@@ -71,24 +111,24 @@ def compute_version_labels_with_indicators(
     comp_ft_norm = _normalize_file_type(comp_ft or "")
     comp_name_lower = (comp_name or "").strip().lower()
 
-    result: List[str] = []
-    for ver in version_info:
+    # Nothing selected: no version can get (*), skip the per-component scan
+    if not selected_comp_id and not comp_ft_norm and not comp_name_lower:
+        return [ver["name"] for ver in version_info]
+
+    norm = _get_norm_index(cached_data)
+    ft_norm_by_vid = norm["ft"]
+    match_vids = norm["by_key"].get((comp_name_lower, comp_ft_norm), ())
+
+    result: List[str] = [""] * len(version_info)
+    for i, ver in enumerate(version_info):
         version_id = ver["id"]
         label = ver["name"]
-        comps_in_ver = components_map.get(version_id, [])
-        ver_ft = components_file_types.get(version_id, {})
-        ver_names = components_names.get(version_id, {})
+        ver_ft_norm = ft_norm_by_vid.get(version_id, {})
 
-        if selected_comp_id in comps_in_ver:
-            if _normalize_file_type(ver_ft.get(selected_comp_id, "")) == comp_ft_norm:
+        if selected_comp_id in ver_ft_norm:
+            if ver_ft_norm[selected_comp_id] == comp_ft_norm:
                 label += " (*)"
-        else:
-            for cid in comps_in_ver:
-                if (
-                    (ver_names.get(cid, "") or "").strip().lower() == comp_name_lower
-                    and _normalize_file_type(ver_ft.get(cid, "")) == comp_ft_norm
-                ):
-                    label += " (*)"
-                    break
-        result.append(label)
+        elif version_id in match_vids:
+            label += " (*)"
+        result[i] = label
     return result
@@ -4,25 +4,37 @@ DCC adapters for Ftrack Input core.
 - standalone: Qt widget context, uses FtrackApiClient / session
 - houdini: HDA bridge, same core, Houdini node/parm access
 - maya: Maya adapter, load_asset_version_data_for_maya, resolve_component_path_maya
+
+Adapters are imported lazily (PEP 562 __getattr__): only the adapter that is
+actually requested gets loaded, so Houdini never imports the Maya adapter and
+vice versa.
 """
 
-# Standalone adapter - available when running outside DCC
-from .standalone import load_asset_version_data_for_standalone
-
-# Houdini adapter - for Houdini finput HDA
-from .houdini import load_asset_version_data_for_houdini
-
-# Maya adapter
-from .maya import (
-    load_asset_version_data_for_maya,
-    resolve_component_path_maya,
-    get_session_for_maya,
-)
-
-__all__ = [
-    "load_asset_version_data_for_standalone",
-    "load_asset_version_data_for_houdini",
-    "load_asset_version_data_for_maya",
-    "resolve_component_path_maya",
-    "get_session_for_maya",
-]
+from importlib import import_module
+
+# Public name -> submodule that provides it
+_LAZY_EXPORTS = {
+    # Standalone adapter - available when running outside DCC
+    "load_asset_version_data_for_standalone": ".standalone",
+    # Houdini adapter - for Houdini finput HDA
+    "load_asset_version_data_for_houdini": ".houdini",
+    # Maya adapter
+    "load_asset_version_data_for_maya": ".maya",
+    "resolve_component_path_maya": ".maya",
+    "get_session_for_maya": ".maya",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache: subsequent lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,31 +6,234 @@ Replaces finput for the new HDA. All logic self-contained, no finput dependency.
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import os
 import socket
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger("ftrack_inout.input.dcc.houdini")
 
+# Event source hostname; resolved once instead of per transfer / subscribe click
+_HOSTNAME = socket.gethostname().lower()
+
+
+# Resolved once on first use; HDA callbacks then skip the import system entirely.
+_get_shared_session = None
+_nu = None
+_fu = None
+
 
 def _get_session():
-    """Session from ftrack_inout.common."""
-    try:
-        from ftrack_inout.common.session_factory import get_shared_session
-        return get_shared_session()
-    except ImportError:
-        return None
+    """Shared session from ftrack_inout.common, or None.
+
+    Asked for on every call rather than kept here, so a session replaced by
+    reset_shared_session() is never used after it was closed.
+    """
+    global _get_shared_session
+    if _get_shared_session is None:
+        try:
+            from ftrack_inout.common.session_factory import get_shared_session
+        except ImportError:
+            return None
+        _get_shared_session = get_shared_session
+    return _get_shared_session()
+
+
+# (session, location) from the last session.pick_location()
+_picked_location: Optional[Tuple[Any, Any]] = None
+
+
+def _pick_location(session: Any) -> Any:
+    """session.pick_location(), resolved once per session (a new session picks again)."""
+    global _picked_location
+    if _picked_location is not None and _picked_location[0] is session:
+        return _picked_location[1]
+    location = session.pick_location()
+    if location:
+        _picked_location = (session, location)
+    return location
 
 
 def _node_utils():
-    from ftrack_houdini.ftrack_hou_utils import node_utils
-    return node_utils
+    global _nu
+    if _nu is None:
+        from ftrack_houdini.ftrack_hou_utils import node_utils
+        _nu = node_utils
+    return _nu
 
 
 def _ftrack_utils():
-    from ftrack_houdini.ftrack_hou_utils import ftrack_utils
-    return ftrack_utils
+    global _fu
+    if _fu is None:
+        from ftrack_houdini.ftrack_hou_utils import ftrack_utils
+        _fu = ftrack_utils
+    return _fu
+
+
+# Heavy modules, imported on first use (not at module load: this module must
+# import outside Houdini too), then served from these globals.
+_hou = None
+_ftrack_api = None
+_event_cls = None
+_tu = None
+_listener = None
+
+
+def _hou_module():
+    global _hou
+    if _hou is None:
+        import hou
+        _hou = hou
+    return _hou
+
+
+def _ftrack_api_module():
+    global _ftrack_api
+    if _ftrack_api is None:
+        import ftrack_api
+        _ftrack_api = ftrack_api
+    return _ftrack_api
+
+
+def _event_class():
+    global _event_cls
+    if _event_cls is None:
+        from ftrack_api.event.base import Event
+        _event_cls = Event
+    return _event_cls
+
+
+def _template_utils():
+    global _tu
+    if _tu is None:
+        from ftrack_houdini.ftrack_hou_utils import template_utils
+        _tu = template_utils
+    return _tu
+
+
+def _listener_module():
+    global _listener
+    if _listener is None:
+        from ftrack_houdini import asset_update_listener
+        _listener = asset_update_listener
+    return _listener
+
+
+# --- profiling ---
+
+# FTRACK_INOUT_PROFILE=1 records hou.perfMon events for the menu/data hot paths
+# (visible in Houdini's Performance Monitor while a profile is recording).
+_PROFILE = os.environ.get("FTRACK_INOUT_PROFILE") == "1"
+
+
+@contextlib.contextmanager
+def _perf(name: str):
+    """hou.perfMon event around a block / function (no-op unless _PROFILE)."""
+    if not _PROFILE:
+        yield
+        return
+    event = _hou_module().perfMon.startEvent("ftrack_inout: %s" % name)
+    try:
+        yield
+    finally:
+        event.stop()
+
+
+_perf_profile = None
+
+
+def toggle_perf_profile(**kwargs) -> None:
+    """Start / stop a hou.perfMon profile (e.g. from a hidden HDA button)."""
+    global _perf_profile
+    hou = _hou_module()
+    nu = _node_utils()
+    node = kwargs.get("node") or hou.pwd()
+    if _perf_profile is None:
+        _perf_profile = hou.perfMon.startProfile("ftrack_inout input")
+        nu.set_parm(node, "log", "Profiling started (set FTRACK_INOUT_PROFILE=1 for events).")
+    else:
+        _perf_profile.stop()
+        _perf_profile = None
+        nu.set_parm(node, "log", "Profiling stopped - see Performance Monitor.")
+
+
+# --- background workers ---
+
+# Background ftrack work (cache refresh, transfer job submission) runs on
+# these threads so HDA callbacks return immediately.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="FtInputWorker")
+_worker_local = threading.local()
+
+
+def _worker_session() -> Any:
+    """
+    Per-worker-thread session, or None if it cannot be created.
+
+    ftrack sessions are not thread-safe to share with the UI thread, so each
+    worker gets its own from session_factory (same env and locations as the
+    shared session). Its event hub is never connected; events go out on the
+    shared session from the main thread.
+    """
+    session = getattr(_worker_local, "session", None)
+    if session is None:
+        try:
+            from ftrack_inout.common.session_factory import create_worker_session
+        except ImportError:
+            return None
+        session = _worker_local.session = create_worker_session()
+    return session
+
+
+# --- asset data cache (stale-while-revalidate) ---
+
+# Served without a server round trip while younger than this (seconds)
+ASSET_DATA_TTL = 30.0
+
+# asset_id -> (load time, data, JSON for userData or None until first needed)
+_asset_cache: Dict[str, Tuple[float, Dict[str, Any], Optional[str]]] = {}
+_asset_inflight: Set[str] = set()
+_asset_cache_lock = threading.Lock()
+
+
+def _refresh_asset_data(asset_id: str, stale_stamp: float) -> None:
+    """
+    Worker: reload asset data on the worker session and store it in the cache.
+
+    The result only replaces the entry stamped stale_stamp; if a foreground
+    load (e.g. force_refresh) stored newer data meanwhile, or the entry was
+    invalidated, it is dropped.
+    """
+    try:
+        session = _worker_session()
+        if not session:
+            logger.warning("Background refresh of asset %s skipped: no worker session", asset_id)
+            return
+        from ftrack_inout.input.core import load_asset_version_component_data
+        data = load_asset_version_component_data(session, asset_id, force_refresh=True)
+        if data:
+            with _asset_cache_lock:
+                entry = _asset_cache.get(asset_id)
+                if entry is not None and entry[0] <= stale_stamp:
+                    _asset_cache[asset_id] = (time.monotonic(), data, None)
+    except Exception as e:
+        logger.warning("Background refresh of asset %s failed: %s", asset_id, e)
+    finally:
+        with _asset_cache_lock:
+            _asset_inflight.discard(asset_id)
+
+
+def invalidate_asset_data_cache(asset_id: Optional[str] = None) -> None:
+    """Forget cached asset data (one asset, or all when asset_id is None)."""
+    with _asset_cache_lock:
+        if asset_id is None:
+            _asset_cache.clear()
+        else:
+            _asset_cache.pop(str(asset_id), None)
 
 
 def load_asset_version_data_for_houdini(
@@ -38,15 +241,162 @@ def load_asset_version_data_for_houdini(
     asset_id: str,
     force_refresh: bool = False,
 ) -> Optional[Dict[str, Any]]:
-    """Load version/component cached data using input core."""
+    """
+    Load version/component cached data using input core.
+
+    Results are cached per asset_id. Fresh entries (< ASSET_DATA_TTL) are
+    returned directly; stale entries are returned too, while a background
+    reload replaces them. force_refresh always queries the server.
+    """
     if not session:
         return None
+    asset_id = str(asset_id)
+    if not force_refresh:
+        with _asset_cache_lock:
+            entry = _asset_cache.get(asset_id)
+            if entry is not None:
+                stamp, data, _json_str = entry
+                if time.monotonic() - stamp >= ASSET_DATA_TTL and asset_id not in _asset_inflight:
+                    _asset_inflight.add(asset_id)
+                    _executor.submit(_refresh_asset_data, asset_id, stamp)
+                return data
+
     from ftrack_inout.input.core import load_asset_version_component_data
-    return load_asset_version_component_data(session, str(asset_id), force_refresh=force_refresh)
+    data = load_asset_version_component_data(session, asset_id, force_refresh=force_refresh)
+    if data:
+        with _asset_cache_lock:
+            _asset_cache[asset_id] = (time.monotonic(), data, None)
+    return data
+
+
+def _asset_data_json(asset_id: str, data: Dict[str, Any]) -> str:
+    """userData JSON for data; serialized once per cache entry and reused afterwards."""
+    asset_id = str(asset_id)
+    with _asset_cache_lock:
+        entry = _asset_cache.get(asset_id)
+    if entry is not None and entry[1] is data and entry[2] is not None:
+        return entry[2]
+    json_str = _dump_asset_data(data)
+    with _asset_cache_lock:
+        entry = _asset_cache.get(asset_id)
+        if entry is not None and entry[1] is data:
+            _asset_cache[asset_id] = (entry[0], data, json_str)
+    return json_str
+
+
+# --- per-node asset data (userData "ftrack_asset_data") ---
+
+# node.sessionId() -> (json string in userData, parsed dict). Bounded (oldest
+# evicted first), dropped on restore_base_interface / onDeleted and cleared
+# when a hip file is loaded or cleared, since session ids are then reused.
+_NODE_ASSET_DATA_MAX = 64
+_node_asset_data: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+_hip_callback_added = False
+
+
+def _on_hip_file_event(event_type: Any) -> None:
+    hou = _hou_module()
+    if event_type in (hou.hipFileEventType.AfterLoad, hou.hipFileEventType.AfterClear):
+        _node_asset_data.clear()
+
+
+def _store_node_asset_data(key: int, json_str: str, data: Dict[str, Any]) -> None:
+    global _hip_callback_added
+    if not _hip_callback_added:
+        try:
+            _hou_module().hipFile.addEventCallback(_on_hip_file_event)
+            _hip_callback_added = True
+        except Exception as e:
+            logger.debug("hipFile event callback not registered: %s", e)
+    _node_asset_data.pop(key, None)
+    if len(_node_asset_data) >= _NODE_ASSET_DATA_MAX:
+        _node_asset_data.pop(next(iter(_node_asset_data)))  # oldest first
+    _node_asset_data[key] = (json_str, data)
+
+
+def _forget_node_asset_data(node: Any) -> None:
+    _node_asset_data.pop(node.sessionId(), None)
+
+
+def _get_cached_asset_data(node: Any) -> Dict[str, Any]:
+    """Parsed ftrack_asset_data of node; re-parsed only when the userData string changed."""
+    json_str = node.userData("ftrack_asset_data") or ""
+    key = node.sessionId()
+    entry = _node_asset_data.get(key)
+    if entry is not None and entry[0] == json_str:
+        return entry[1]
+    data = json.loads(json_str) if json_str else {}
+    _store_node_asset_data(key, json_str, data)
+    return data
+
+
+def _dump_asset_data(data: Dict[str, Any]) -> str:
+    # Private keys (e.g. "_norm" from version_indicators) are in-memory only
+    return json.dumps({k: v for k, v in data.items() if not k.startswith("_")})
+
+
+def _set_asset_data(node: Any, data: Dict[str, Any], json_str: Optional[str] = None) -> None:
+    """Store asset data in node userData and prime the parse cache."""
+    if json_str is None:
+        json_str = _dump_asset_data(data)
+    node.setUserData("ftrack_asset_data", json_str)
+    _store_node_asset_data(node.sessionId(), json_str, data)
+
+
+# --- menu callback debounce ---
+
+# Wheeling through a menu fires its callback for every intermediate value;
+# only the last selection within this window (ms) does the actual rebuild.
+CALLBACK_DEBOUNCE_MS = 50
+
+# (kind, node.sessionId()) -> (generation, pending call)
+_debounce_pending: Dict[Tuple[str, int], Tuple[int, Callable[[], None]]] = {}
+_qt_core = None
+
+
+def _get_qt_core() -> Any:
+    """QtCore when a Qt application is running (Houdini UI), else None (hython)."""
+    global _qt_core
+    if _qt_core is None:
+        try:
+            from PySide6 import QtCore  # type: ignore
+        except ImportError:
+            try:
+                from PySide2 import QtCore  # type: ignore
+            except ImportError:
+                QtCore = False
+        _qt_core = QtCore
+    if _qt_core and _qt_core.QCoreApplication.instance() is not None:
+        return _qt_core
+    return None
+
+
+def _debounce(key: Tuple[str, int], fn: Callable[[], None]) -> None:
+    """Run fn CALLBACK_DEBOUNCE_MS after the last call with the same key."""
+    qt_core = _get_qt_core()
+    if qt_core is None:
+        fn()
+        return
+    generation = _debounce_pending.get(key, (0, None))[0] + 1
+    _debounce_pending[key] = (generation, fn)
+    qt_core.QTimer.singleShot(CALLBACK_DEBOUNCE_MS, lambda: _run_debounced(key, generation))
+
+
+def _run_debounced(key: Tuple[str, int], generation: int) -> None:
+    entry = _debounce_pending.get(key)
+    if entry is None or entry[0] != generation:
+        return  # superseded by a later call
+    del _debounce_pending[key]
+    try:
+        entry[1]()
+    except Exception as e:
+        # e.g. node deleted before the timer fired
+        logger.warning("Deferred menu callback failed: %s", e, exc_info=True)
 
 
 # --- build_version_component_menus ---
 
+@_perf("build_version_component_menus")
 def build_version_component_menus(
     node: Any,
     asset_id: str,
@@ -56,7 +406,7 @@ def build_version_component_menus(
     force_refresh: bool = False,
 ) -> bool:
     """Build version/component menus using input core."""
-    import hou
+    hou = _hou_module()
     nu = _node_utils()
     if not node or not asset_id:
         logger.error("build_version_component_menus: node or asset_id is missing.")
@@ -86,54 +436,66 @@ def build_version_component_menus(
             return False
 
         version_info = cached_data["version_info"]
-        node.setUserData("ftrack_asset_data", json.dumps(cached_data))
+        json_str = _asset_data_json(asset_id, cached_data)
+        # Same data as the menus already on the node: skip the template rebuild
+        menus_unchanged = (
+            node.userData("ftrack_asset_data") == json_str
+            and node.parm("version_menu") is not None
+        )
+        _set_asset_data(node, cached_data, json_str)
         logger.info("Cached data for %d versions", len(version_info))
 
-        ptg = node.parmTemplateGroup()
-        if ptg.find("version_menu"):
-            ptg.remove("version_menu")
-        if ptg.find("component_menu"):
-            ptg.remove("component_menu")
-        node.setParmTemplateGroup(ptg)
-        ptg = node.parmTemplateGroup()
-
-        comp_name_tpl = ptg.find("ComponentName")
-        if comp_name_tpl:
-            comp_name_tpl.setJoinWithNext(True)
-            ptg.replace("ComponentName", comp_name_tpl)
-
         version_menu_items = [v["id"] for v in version_info]
-        version_menu_labels = [v["name"] for v in version_info]
-        version_menu = hou.MenuParmTemplate(
-            "version_menu", "Version",
-            menu_items=version_menu_items,
-            menu_labels=version_menu_labels,
-        )
-        version_menu.setScriptCallback("hou.phm().ftrack_hda.applyVersionSelection(**kwargs)")
-        version_menu.setScriptCallbackLanguage(hou.scriptLanguage.Python)
-        version_menu.hideLabel(True)
-        version_menu.setJoinWithNext(True)
-        ptg.insertAfter(ptg.find("ComponentName"), version_menu)
-        node.setParmTemplateGroup(ptg)
 
-        version_to_select = None
-        if version_to_select_id and version_to_select_id in version_menu_items:
-            version_to_select = version_to_select_id
-        elif preserve_selection and current_version_id and current_version_id in version_menu_items:
-            version_to_select = current_version_id
-        elif version_menu_items:
-            version_to_select = version_info[0]["id"]
-        if version_to_select:
-            node.parm("version_menu").set(version_to_select)
+        # Internal refresh: keep menu rebuilds out of the undo stack
+        with hou.undos.disabler():
+            if not menus_unchanged:
+                # Edit one template group and push it to the node once: every
+                # setParmTemplateGroup rebuilds the node's parm UI.
+                # component_menu is left in place - _apply_version_selection replaces it.
+                ptg = node.parmTemplateGroup()
+
+                comp_name_tpl = ptg.find("ComponentName")
+                if comp_name_tpl:
+                    comp_name_tpl.setJoinWithNext(True)
+                    ptg.replace("ComponentName", comp_name_tpl)
+
+                version_menu_labels = [v["name"] for v in version_info]
+                version_menu = hou.MenuParmTemplate(
+                    "version_menu", "Version",
+                    menu_items=version_menu_items,
+                    menu_labels=version_menu_labels,
+                )
+                version_menu.setScriptCallback("hou.phm().ftrack_hda.applyVersionSelection(**kwargs)")
+                version_menu.setScriptCallbackLanguage(hou.scriptLanguage.Python)
+                version_menu.hideLabel(True)
+                version_menu.setJoinWithNext(True)
+                if ptg.find("version_menu"):
+                    ptg.replace("version_menu", version_menu)
+                else:
+                    ptg.insertAfter(ptg.find("ComponentName"), version_menu)
+                node.setParmTemplateGroup(ptg)
+
+            version_to_select = None
+            if version_to_select_id and version_to_select_id in version_menu_items:
+                version_to_select = version_to_select_id
+            elif preserve_selection and current_version_id and current_version_id in version_menu_items:
+                version_to_select = current_version_id
+            elif version_menu_items:
+                version_to_select = version_info[0]["id"]
+            if version_to_select:
+                node.parm("version_menu").set(version_to_select)
 
         _apply_version_selection(node=node, component_to_select_name=component_to_select_name)
 
         asset_name = cached_data.get("asset_name", "")
         asset_type = cached_data.get("asset_type", "")
-        nu.set_parm(node, "asset_id", asset_id)
-        nu.set_parm(node, "asset_name", asset_name)
-        nu.set_parm(node, "Type", asset_type)
-        nu.set_parm(node, "log", "Loaded: %s (%d versions)" % (asset_name, len(version_info)))
+        nu.set_multiple_parms(node, {
+            "asset_id": asset_id,
+            "asset_name": asset_name,
+            "Type": asset_type,
+            "log": "Loaded: %s (%d versions)" % (asset_name, len(version_info)),
+        })
         return True
 
     except Exception as e:
@@ -142,16 +504,16 @@ def build_version_component_menus(
         return False
 
 
+@_perf("apply_version_selection")
 def _apply_version_selection(
     node: Any,
     component_to_select_name: Optional[str] = None,
 ) -> None:
     """Build component menu from cached_data using input.core."""
-    import hou
+    hou = _hou_module()
     from ftrack_inout.input.core import get_component_menu_data, resolve_component_to_select
 
-    json_str = node.userData("ftrack_asset_data")
-    cached_data = json.loads(json_str) if json_str else {}
+    cached_data = _get_cached_asset_data(node)
     if not cached_data:
         return
     ver_menu = node.parm("version_menu")
@@ -167,38 +529,44 @@ def _apply_version_selection(
         previous_comp_id=prev_comp_id or None,
     )
     nu = _node_utils()
-    ptg = node.parmTemplateGroup()
-    if ptg.find("component_menu"):
-        ptg.remove("component_menu")
-    node.setParmTemplateGroup(ptg)
-    ptg = node.parmTemplateGroup()
-    if not items:
-        return
-    comp_menu = hou.MenuParmTemplate("component_menu", "Component", menu_items=items, menu_labels=labels)
-    comp_menu.setScriptCallback("hou.phm().ftrack_hda.applyCompSelection(**kwargs)")
-    comp_menu.setScriptCallbackLanguage(hou.scriptLanguage.Python)
-    comp_menu.hideLabel(True)
-    ptg.insertAfter(ptg.find("version_menu"), comp_menu)
-    node.setParmTemplateGroup(ptg)
-    idx = items.index(to_select) if to_select in items else 0
-    node.parm("component_menu").set(items[idx])
-    applyCompSelection(node=node)
+    with hou.undos.disabler():
+        ptg = node.parmTemplateGroup()
+        if not items:
+            if ptg.find("component_menu"):
+                ptg.remove("component_menu")
+                node.setParmTemplateGroup(ptg)
+            return
+        comp_menu = hou.MenuParmTemplate("component_menu", "Component", menu_items=items, menu_labels=labels)
+        comp_menu.setScriptCallback("hou.phm().ftrack_hda.applyCompSelection(**kwargs)")
+        comp_menu.setScriptCallbackLanguage(hou.scriptLanguage.Python)
+        comp_menu.hideLabel(True)
+        if ptg.find("component_menu"):
+            ptg.replace("component_menu", comp_menu)
+        else:
+            ptg.insertAfter(ptg.find("version_menu"), comp_menu)
+        node.setParmTemplateGroup(ptg)
+        idx = items.index(to_select) if to_select in items else 0
+        node.parm("component_menu").set(items[idx])
+    _apply_comp_selection(node)
 
 
 def applyVersionSelection(**kwargs) -> None:
-    """Version changed — rebuild component menu."""
-    import hou
+    """Version changed — rebuild component menu (debounced)."""
+    hou = _hou_module()
     node = kwargs.get("node") or hou.pwd()
     comp_name = kwargs.get("component_to_select_name")
-    _apply_version_selection(node=node, component_to_select_name=comp_name)
+    _debounce(
+        ("version", node.sessionId()),
+        lambda: _apply_version_selection(node=node, component_to_select_name=comp_name),
+    )
 
 
 def _update_version_menu_indicators(node: Any) -> None:
     """Update version menu labels with (*) for matching components."""
+    hou = _hou_module()
     from ftrack_inout.input.core import compute_version_labels_with_indicators
 
-    json_str = node.userData("ftrack_asset_data")
-    cached_data = json.loads(json_str) if json_str else {}
+    cached_data = _get_cached_asset_data(node)
     if not cached_data or not cached_data.get("version_info"):
         return
     comp_menu = node.parm("component_menu")
@@ -218,20 +586,24 @@ def _update_version_menu_indicators(node: Any) -> None:
     if version_menu_template and labels:
         version_menu_template.setMenuLabels(labels)
         ptg.replace("version_menu", version_menu_template)
-        node.setParmTemplateGroup(ptg)
+        with hou.undos.disabler():
+            node.setParmTemplateGroup(ptg)
 
 
 def applyCompSelection(**kwargs) -> None:
-    """Component selected — load data and update indicators."""
-    import hou
-    nu = _node_utils()
+    """Component selected — load data and update indicators (debounced)."""
+    hou = _hou_module()
     node = kwargs.get("node")
     if not node:
         node = hou.pwd()
+    _debounce(("component", node.sessionId()), lambda: _apply_comp_selection(node))
 
+
+def _apply_comp_selection(node: Any) -> None:
+    """Apply the selected component to the node parms and refresh (*) indicators."""
+    nu = _node_utils()
     nu.set_parm(node, "log", "Applying component...")
     try:
-        session = _get_session()
         comp_menu = node.parm("component_menu")
         ver_menu = node.parm("version_menu")
         if not comp_menu or not ver_menu:
@@ -242,18 +614,29 @@ def applyCompSelection(**kwargs) -> None:
         ver_id = ver_menu.evalAsString()
         logger.info("Applying Version ID: %s, Component ID: %s", ver_id, comp_id)
 
-        component = session.get("Component", comp_id)
-        if not component:
-            raise Exception("Component ID '%s' not found." % comp_id)
+        # Menus were built from the node's cached asset data - read from it
+        # rather than fetching the Component from the server.
+        cached_data = _get_cached_asset_data(node)
+        comp_name = (cached_data.get("components_names") or {}).get(ver_id, {}).get(comp_id)
+        ver_num = next(
+            (v["version"] for v in cached_data.get("version_info") or [] if v["id"] == ver_id),
+            None,
+        )
+        if comp_name is None or ver_num is None:
+            component = _get_session().get("Component", comp_id)
+            if not component:
+                raise Exception("Component ID '%s' not found." % comp_id)
+            version = component["version"]
+            comp_id, comp_name = component["id"], component["name"]
+            ver_id, ver_num = version["id"], version["version"]
 
-        version = component["version"]
         parms_to_set = {
-            "AssetVersion": version["id"],
-            "ComponentName": component["name"],
-            "componentid": component["id"],
-            "variables": json.dumps({"FTRACK_COMPONENT_ID": component["id"]}),
-            "log": "Applied: v%03d / %s" % (version["version"], component["name"]),
-            "__ftrack_used_CompId": component["id"],
+            "AssetVersion": ver_id,
+            "ComponentName": comp_name,
+            "componentid": comp_id,
+            "variables": json.dumps({"FTRACK_COMPONENT_ID": comp_id}),
+            "log": "Applied: v%03d / %s" % (ver_num, comp_name),
+            "__ftrack_used_CompId": comp_id,
         }
         nu.set_multiple_parms(node, parms_to_set)
         logger.info("Successfully applied component data to node.")
@@ -264,12 +647,67 @@ def applyCompSelection(**kwargs) -> None:
         nu.set_parm(node, "log", "ERROR: %s" % e)
 
 
+def _context_path(asset_entity: Any) -> str:
+    """"project:ancestors:asset" of asset_entity (ancestors are populated by get_data)."""
+    return "{}:{}:{}".format(
+        asset_entity["parent"]["project"]["name"],
+        ":".join(x["name"] for x in asset_entity["ancestors"]),
+        asset_entity["name"],
+    )
+
+
+def _find_transfer_source_location_id(session: Any, component: Any, current_location: Any) -> str:
+    """
+    Id of another location that holds component (transfer source), or "".
+
+    One ComponentLocation query lists every location that has the component;
+    falls back to asking each Location for availability if that query fails.
+    """
+    current_id = current_location["id"] if current_location else None
+    try:
+        rows = session.query(
+            'select location_id from ComponentLocation where component_id is "%s"'
+            % component["id"]
+        ).all()
+        for row in rows:
+            if row["location_id"] != current_id:
+                return row["location_id"]
+        return ""
+    except Exception as e:
+        logger.debug("ComponentLocation query failed, scanning locations: %s", e)
+
+    try:
+        all_locations = session.query("Location").all()
+    except Exception:
+        all_locations = []
+    for loc in all_locations or []:
+        try:
+            if loc["id"] == current_id:
+                continue
+            src_av = loc.get_component_availability(component)
+            if src_av and src_av > 0.0:
+                return loc["id"]
+        except Exception:
+            continue
+    return ""
+
+
 # --- get_data ---
 
+# Availability is a float percentage; treat rounding noise below 100 as complete
+FULLY_AVAILABLE = 99.999
+
+_GET_DATA_PROJECTIONS = (
+    "version, asset.id, asset.name, asset.type.name, "
+    "asset.parent.project.name, asset.ancestors.name"
+)
+_GET_DATA_COMPONENT_PROJECTIONS = "components, components.id, components.name, components.metadata"
+
+
+@_perf("get_data")
 def get_data(**kwargs) -> None:
     """Fetch data for selected AssetVersion and populate HDA parameters."""
-    import hou
-    import ftrack_api
+    ftrack_api = _ftrack_api_module()
     nu = _node_utils()
     fu = _ftrack_utils()
     node = kwargs.get("node")
@@ -306,6 +744,16 @@ def get_data(**kwargs) -> None:
         nu.set_parm(node, "log", "ERROR: Invalid AssetVersion ID.")
         return
 
+    # Load everything get_data reads below in one round trip instead of a
+    # lazy fetch per attribute chain.
+    projections = _GET_DATA_PROJECTIONS
+    if not asset_version_only_mode:
+        projections += ", " + _GET_DATA_COMPONENT_PROJECTIONS
+    try:
+        fu.get_session().populate([asset_version_entity], projections)
+    except Exception as e:
+        logger.debug("get_data: populate failed, falling back to lazy loads: %s", e)
+
     nu.set_parm(node, "__ftrack_AssetVersion", asset_version_id)
     asset_entity = asset_version_entity["asset"]
     asset_type = asset_entity["type"]["name"]
@@ -323,33 +771,28 @@ def get_data(**kwargs) -> None:
             "componentid": "",
             "ComponentName": "",
         }
-        project_name = asset_entity["parent"]["project"]["name"]
-        context_path = "{}:{}:{}".format(
-            project_name,
-            ":".join(x["name"] for x in asset_entity["ancestors"]),
-            asset_entity["name"],
-        )
+        context_path = _context_path(asset_entity)
         variables = {
-            "ASSET_NAME": str(asset_entity["name"]),
-            "ASSET_TYPE_NAME": str(asset_type),
-            "ASSET_ID": str(asset_entity["id"]),
+            "ASSET_NAME": asset_name,
+            "ASSET_TYPE_NAME": asset_type,
+            "ASSET_ID": asset_id,
             "VERSION_NUMBER": str(int(asset_version_entity["version"])),
             "REFERENCE_OBJECT": "",
-            "CONTEXT_PATH": str(context_path),
+            "CONTEXT_PATH": context_path,
             "COMPONENT_NAME": "",
             "COMPONENT_ID": "",
             "COMPONENT_PATH": "",
         }
+        parms_to_set["metadict"] = {}
+        parms_to_set["variables"] = variables
         nu.set_multiple_parms(node, parms_to_set)
-        nu.set_parm(node, "metadict", {})
-        nu.set_parm(node, "variables", variables)
     else:
         session = fu.get_session()
         if not session:
             logger.error("Ftrack session not available.")
             return
         try:
-            location = session.pick_location()
+            location = _pick_location(session)
             if not location:
                 raise ftrack_api.exception.LocationError("Could not pick a location.")
         except Exception as e:
@@ -357,21 +800,15 @@ def get_data(**kwargs) -> None:
             nu.set_parm(node, "log", "ERROR: Ftrack location error.")
             return
 
-        try:
-            session.populate([asset_version_entity], "components, components.name, components.id")
-        except Exception:
-            pass
         comp_id_param = nu.get_parm_evaluated_string(node, "componentid")
-        selected_component = None
-        for c in asset_version_entity.get("components") or []:
-            if c["id"] == comp_id_param:
-                selected_component = c
-                break
+        components = asset_version_entity.get("components") or []
+        selected_component = {c["id"]: c for c in components}.get(comp_id_param)
         if not selected_component and comp_name:
-            for c in asset_version_entity.get("components") or []:
-                if (c.get("name") or "").lower() == comp_name.lower():
-                    selected_component = c
-                    break
+            components_by_lname: Dict[str, Any] = {}
+            for c in components:
+                # first component wins on duplicate names
+                components_by_lname.setdefault((c.get("name") or "").lower(), c)
+            selected_component = components_by_lname.get(comp_name.lower())
 
         if not selected_component:
             logger.warning("Component not found")
@@ -387,25 +824,20 @@ def get_data(**kwargs) -> None:
             "asset_name": asset_name,
         }
         meta = dict(selected_component.get("metadata") or {})
-        project_name = asset_entity["parent"]["project"]["name"]
-        context_path = "{}:{}:{}".format(
-            project_name,
-            ":".join(x["name"] for x in asset_entity["ancestors"]),
-            asset_entity["name"],
-        )
+        context_path = _context_path(asset_entity)
         variables = {
-            "ASSET_NAME": str(asset_entity["name"]),
-            "ASSET_TYPE_NAME": str(asset_type),
-            "ASSET_ID": str(asset_entity["id"]),
+            "ASSET_NAME": asset_name,
+            "ASSET_TYPE_NAME": asset_type,
+            "ASSET_ID": asset_id,
             "VERSION_NUMBER": str(int(asset_version_entity["version"])),
             "REFERENCE_OBJECT": "",
-            "CONTEXT_PATH": str(context_path),
-            "COMPONENT_NAME": str(selected_component["name"]),
-            "COMPONENT_ID": str(selected_component["id"]),
+            "CONTEXT_PATH": context_path,
+            "COMPONENT_NAME": selected_component["name"],
+            "COMPONENT_ID": selected_component["id"],
             "COMPONENT_PATH": "",
         }
         component_path = ""
-        if availability == 100.0:
+        if availability >= FULLY_AVAILABLE:
             try:
                 from ftrack_inout.input.core import resolve_component_path
                 component_path = resolve_component_path(
@@ -413,55 +845,28 @@ def get_data(**kwargs) -> None:
                 )
             except ValueError:
                 component_path = ""
-            if component_path:
-                parms_to_set["file_path"] = component_path
-                variables["COMPONENT_PATH"] = component_path
-            else:
-                parms_to_set["file_path"] = ""
-        else:
-            parms_to_set["file_path"] = ""
+        parms_to_set["file_path"] = component_path
+        if component_path:
+            variables["COMPONENT_PATH"] = component_path
+
+        parms_to_set["metadict"] = meta
+        parms_to_set["variables"] = variables
+        parms_to_set["__ftrack_used_CompId"] = selected_component["id"]
+
+        # Transfer button state: ready only when another location holds the component
+        parms_to_set["transfer_ready"] = 0
+        parms_to_set["transfer_from_id"] = ""
+        parms_to_set["transfer_to_id"] = ""
+        if not component_path:
+            src_loc_id = _find_transfer_source_location_id(
+                session, selected_component, location
+            )
+            if src_loc_id:
+                parms_to_set["transfer_ready"] = 1
+                parms_to_set["transfer_from_id"] = src_loc_id
+                parms_to_set["transfer_to_id"] = location["id"]
 
         nu.set_multiple_parms(node, parms_to_set)
-        nu.set_parm(node, "metadict", meta)
-        nu.set_parm(node, "variables", variables)
-        nu.set_parm(node, "__ftrack_used_CompId", selected_component["id"])
-
-        try:
-            if node.parm("transfer_ready"):
-                node.parm("transfer_ready").set(0)
-            if node.parm("transfer_from_id"):
-                node.parm("transfer_from_id").set("")
-            if node.parm("transfer_to_id"):
-                node.parm("transfer_to_id").set("")
-            if availability < 100.0 or (availability == 100.0 and not component_path):
-                src_loc_id = ""
-                try:
-                    all_locations = fu.get_session().query("Location").all()
-                except Exception:
-                    all_locations = []
-                current_location = location
-                for loc in all_locations or []:
-                    try:
-                        if current_location and loc["id"] == current_location["id"]:
-                            continue
-                        src_av = loc.get_component_availability(selected_component)
-                        if src_av and src_av > 0.0:
-                            src_loc_id = loc["id"]
-                            break
-                    except Exception:
-                        continue
-                if src_loc_id:
-                    try:
-                        if node.parm("transfer_ready"):
-                            node.parm("transfer_ready").set(1)
-                        if node.parm("transfer_from_id"):
-                            node.parm("transfer_from_id").set(src_loc_id)
-                        if node.parm("transfer_to_id") and location:
-                            node.parm("transfer_to_id").set(location["id"])
-                    except Exception:
-                        pass
-        except Exception:
-            pass
 
     success = build_version_component_menus(
         node,
@@ -478,8 +883,7 @@ def get_data(**kwargs) -> None:
             nu.set_parm(node, "log", "%s: %s (%s)" % (action, asset_name, comp_name))
         else:
             selected_comp_id = node.parm("component_menu").evalAsString()
-            json_string = node.userData("ftrack_asset_data")
-            cached_data = json.loads(json_string) if json_string else {}
+            cached_data = _get_cached_asset_data(node)
             ver_id = node.parm("version_menu").evalAsString() if node.parm("version_menu") else None
             comp_name_map = (cached_data.get("components_names") or {}).get(ver_id, {}) if ver_id else {}
             final_comp_name = comp_name_map.get(selected_comp_id, selected_comp_id)
@@ -547,8 +951,8 @@ def get_fromcomp(**kwargs) -> None:
 
 def create_node(**kwargs) -> None:
     """Create internal node network from selected component."""
-    from ftrack_houdini.ftrack_hou_utils.template_utils import TemplateManager, create_node_from_template
-
+    hou = _hou_module()
+    tu = _template_utils()
     nu = _node_utils()
     fu = _ftrack_utils()
     hda_node = kwargs.get("node")
@@ -556,20 +960,18 @@ def create_node(**kwargs) -> None:
         return
 
     try:
-        tm = TemplateManager()
+        tm = tu.TemplateManager()
     except Exception as e:
         logger.error("TemplateManager init failed: %s", e)
         return
 
     component_id = nu.get_parm_evaluated_string(hda_node, "componentid")
     if not component_id:
-        import hou
         hou.ui.displayMessage("Please select a component from the menu before creating.", title="Ftrack Loader")
         return
 
     component_entity = fu.get_entity("Component", component_id)
     if not component_entity:
-        import hou
         hou.ui.displayMessage("Could not find component %s in Ftrack." % component_id, title="Ftrack Loader Error")
         return
 
@@ -589,13 +991,12 @@ def create_node(**kwargs) -> None:
         except ValueError:
             component_path = ""
     if not component_path:
-        import hou
         hou.ui.displayMessage("Could not determine file path for component.", title="Ftrack Loader Error")
         return
 
     nu.set_parm(hda_node, "file_path", component_path)
 
-    subnet_node = create_node_from_template(
+    subnet_node = tu.create_node_from_template(
         template_manager=tm,
         hda_node=hda_node,
         asset_type=asset_type,
@@ -603,7 +1004,6 @@ def create_node(**kwargs) -> None:
         file_format=file_format,
     )
 
-    import hou
     if subnet_node:
         subnet_pos = subnet_node.position()
         hou.ui.displayMessage(
@@ -629,6 +1029,25 @@ def create_node(**kwargs) -> None:
 
 _transfer_dialog_instance = None
 
+# Location id -> display name (label or name). Locations are static per session.
+_location_display: Dict[str, str] = {}
+
+
+def _get_location_display(session: Any, location_id: str) -> str:
+    """Label (or name) of a location; all locations are fetched once, on first use."""
+    if not _location_display:
+        try:
+            for loc in session.query("select id, name, label from Location").all():
+                _location_display[loc["id"]] = loc.get("label") or loc.get("name") or loc["id"]
+        except Exception as e:
+            logger.debug("Location label query failed: %s", e)
+    return _location_display.get(location_id, location_id)
+
+
+def invalidate_location_cache() -> None:
+    """Forget cached location labels (e.g. after locations were reconfigured)."""
+    _location_display.clear()
+
 
 def _ensure_transfer_dialog(session: Any) -> Any:
     global _transfer_dialog_instance
@@ -644,9 +1063,8 @@ def _ensure_transfer_dialog(session: Any) -> Any:
 
 def transferToLocal(**kwargs) -> None:
     """Start transfer of selected component."""
-    import hou
+    hou = _hou_module()
     nu = _node_utils()
-    fu = _ftrack_utils()
     node = kwargs.get("node") or hou.pwd()
 
     try:
@@ -665,29 +1083,42 @@ def transferToLocal(**kwargs) -> None:
         nu.set_parm(node, "log", "Transfer: Not ready (check availability/locations).")
         return
 
+    nu.set_parm(node, "log", "Transfer: submitting job...")
+    _executor.submit(_submit_transfer, node.path(), comp_id, comp_name, from_id, to_id)
+
+
+# api_user -> User id (constant for the process lifetime)
+_user_id_cache: Dict[str, str] = {}
+
+
+def _get_user_id(session: Any) -> str:
+    username = session.api_user
+    user_id = _user_id_cache.get(username)
+    if user_id is None:
+        user = session.query('select id from User where username is "%s"' % username).one()
+        user_id = _user_id_cache[username] = user["id"]
+    return user_id
+
+
+def _submit_transfer(node_path: str, comp_id: str, comp_name: str, from_id: str, to_id: str) -> None:
+    """Worker: create the transfer Job and build the request event; hand both to the main thread."""
+    hou = _hou_module()
     selection_entities = [{"entityType": "Component", "entityId": comp_id}]
 
     try:
-        session = fu.get_session()
+        session = _worker_session()
         if not session:
-            nu.set_parm(node, "log", "Transfer: Failed to get ftrack session.")
+            hou.executeInMainThreadWithResult(
+                lambda: _node_utils().set_parm(hou.node(node_path), "log", "Transfer: Failed to get ftrack session.")
+            )
             return
 
-        user = session.query('User where username is "%s"' % session.api_user).one()
-        user_id = user["id"]
+        user_id = _get_user_id(session)
 
-        from_loc_name, to_loc_name = from_id, to_id
-        try:
-            from_loc = session.query('select id, name, label from Location where id is "%s"' % from_id).first()
-            if from_loc:
-                from_loc_name = from_loc.get("label") or from_loc.get("name") or from_id
-            to_loc = session.query('select id, name, label from Location where id is "%s"' % to_id).first()
-            if to_loc:
-                to_loc_name = to_loc.get("label") or to_loc.get("name") or to_id
-        except Exception:
-            pass
+        from_loc_name = _get_location_display(session, from_id)
+        to_loc_name = _get_location_display(session, to_id)
 
-        from ftrack_api.event.base import Event
+        Event = _event_class()
 
         job_meta = {
             "tag": "mroya_transfer",
@@ -717,44 +1148,75 @@ def transferToLocal(**kwargs) -> None:
             "ignore_component_not_in_location": False,
             "ignore_location_errors": False,
         }
-        current_hostname = socket.gethostname().lower()
         current_username = session.api_user or ""
         event = Event(
             topic="mroya.transfer.request",
             data=payload,
-            source={"hostname": current_hostname, "user": {"username": current_username}},
+            source={"hostname": _HOSTNAME, "user": {"username": current_username}},
         )
+
+        comp_display = comp_name or "component"
         try:
-            session.event_hub.connect()
+            from ftrack_inout.common.path_from_project import get_component_display_path
+            comp_display = get_component_display_path(session, str(comp_id)) or comp_display
         except Exception:
             pass
-        session.event_hub.publish(event, on_error="ignore")
+    except Exception as e:
+        logger.error("Transfer error: %s", e, exc_info=True)
+        msg = "Transfer failed: %s" % e
+        hou.executeInMainThreadWithResult(
+            lambda: _node_utils().set_parm(hou.node(node_path), "log", msg)
+        )
+        return
 
-        nu.set_parm(node, "log", "Transfer started: Job %s" % job_id)
+    hou.executeInMainThreadWithResult(
+        lambda: _on_transfer_submitted(node_path, event, job_id, comp_id, comp_display, to_loc_name)
+    )
 
-        dialog = _ensure_transfer_dialog(session)
-        if dialog:
-            try:
-                comp_display = comp_name or "component"
-                try:
-                    from ftrack_inout.common.path_from_project import get_component_display_path
-                    comp_display = get_component_display_path(session, str(comp_id)) or comp_display
-                except Exception:
-                    pass
-                dialog.add_job({"id": job_id, "status": "running"}, comp_display, to_loc_name, comp_id)
-            except Exception as e:
-                logger.warning("Failed to add job to dialog: %s", e)
 
-    except Exception as e:
-        logger.error("Transfer error: %s", e, exc_info=True)
-        nu.set_parm(node, "log", "Transfer failed: %s" % e)
+def _on_transfer_submitted(
+    node_path: str, event: Any, job_id: str, comp_id: str, comp_display: str, to_loc_name: str
+) -> None:
+    """Main thread: publish the request on the shared session, log the job and show it in the transfer dialog."""
+    hou = _hou_module()
+    session = _ftrack_utils().get_session()
+    if not session:
+        _node_utils().set_parm(hou.node(node_path), "log", "Transfer: Failed to get ftrack session.")
+        return
+    # The shared session's hub stays connected, so this connects at most once
+    _publish_events(session, [event])
+    _node_utils().set_parm(hou.node(node_path), "log", "Transfer started: Job %s" % job_id)
+    dialog = _ensure_transfer_dialog(session)
+    if dialog:
+        try:
+            dialog.add_job({"id": job_id, "status": "running"}, comp_display, to_loc_name, comp_id)
+        except Exception as e:
+            logger.warning("Failed to add job to dialog: %s", e)
 
 
 # --- toggle_subscribe_updates ---
 
+def _publish_events(session: Any, events: List[Any]) -> None:
+    """
+    Publish events on session's hub, connecting at most once for the batch.
+
+    ftrack_api has no bulk publish, so events go out one by one over the
+    same connection. Callers handling several nodes should collect their
+    events and make one call.
+    """
+    hub = session.event_hub
+    if not getattr(hub, "connected", False):
+        try:
+            hub.connect()
+        except Exception:
+            pass
+    for event in events:
+        hub.publish(event, on_error="ignore")
+
+
 def toggle_subscribe_updates(**kwargs) -> None:
     """Subscribe/unsubscribe to asset updates."""
-    import hou
+    hou = _hou_module()
     nu = _node_utils()
     node = kwargs.get("node")
     if not node:
@@ -786,7 +1248,7 @@ def toggle_subscribe_updates(**kwargs) -> None:
         target_location_id = None
         target_location_name = None
         try:
-            location = session.pick_location()
+            location = _pick_location(session)
             if location:
                 target_location_id = location["id"]
                 target_location_name = location["name"]
@@ -794,15 +1256,11 @@ def toggle_subscribe_updates(**kwargs) -> None:
             pass
 
         scene_path = hou.hipFile.path()
-        hostname = socket.gethostname().lower()
 
+        current_username = getattr(session, "api_user", None) or ""
+        source = {"hostname": _HOSTNAME, "user": {"username": current_username}}
+        Event = _event_class()
         if is_subscribed:
-            try:
-                session.event_hub.connect()
-            except Exception:
-                pass
-            current_username = getattr(session, "api_user", None) or ""
-            from ftrack_api.event.base import Event
             event = Event(
                 topic="mroya.asset.watch",
                 data={
@@ -819,31 +1277,23 @@ def toggle_subscribe_updates(**kwargs) -> None:
                     "update_action": "wait_location",
                     "notify_dcc": True,
                 },
-                source={"hostname": hostname, "user": {"username": current_username}},
+                source=source,
             )
-            session.event_hub.publish(event, on_error="ignore")
+            _publish_events(session, [event])
             try:
-                from ftrack_houdini.asset_update_listener import color_node_subscribed
-                color_node_subscribed(node)
+                _listener_module().color_node_subscribed(node)
             except Exception:
                 pass
             nu.set_parm(node, "log", "Subscribed to updates: %s/%s" % (asset["name"], component["name"]))
         else:
-            try:
-                session.event_hub.connect()
-            except Exception:
-                pass
-            current_username = getattr(session, "api_user", None) or ""
-            from ftrack_api.event.base import Event
             event = Event(
                 topic="mroya.asset.unwatch",
                 data={"asset_id": asset["id"], "component_name": component["name"]},
-                source={"hostname": hostname, "user": {"username": current_username}},
+                source=source,
             )
-            session.event_hub.publish(event, on_error="ignore")
+            _publish_events(session, [event])
             try:
-                from ftrack_houdini.asset_update_listener import color_node_default
-                color_node_default(node)
+                _listener_module().color_node_default(node)
             except Exception:
                 pass
             nu.set_parm(node, "log", "Unsubscribed from %s/%s" % (asset["name"], component["name"]))
@@ -857,7 +1307,7 @@ def toggle_subscribe_updates(**kwargs) -> None:
 
 def create_base_interface(**kwargs) -> Any:
     """Create base interface from HDA definition."""
-    import hou
+    hou = _hou_module()
     node = kwargs.get("node")
     if not node:
         return None
@@ -881,12 +1331,15 @@ def restore_base_interface(**kwargs) -> bool:
             "AssetVersion", "ComponentName", "componentid",
             "file_path", "test", "metadict", "variables",
         ]
-        saved_values = {name: node.parm(name).eval() for name in params_to_preserve if node.parm(name)}
+        # One node.parms() pass instead of two node.parm() lookups per name
+        existing = {p.name(): p for p in node.parms()}
+        saved_values = {name: existing[name].eval() for name in params_to_preserve if name in existing}
         base_ptg = create_base_interface(**kwargs)
         if base_ptg:
             node.setParmTemplateGroup(base_ptg)
             nu.set_multiple_parms(node, saved_values)
             node.setUserData("ftrack_asset_data", "{}")
+            _forget_node_asset_data(node)
             logger.info("Base interface restored for %s", node.name())
             return True
         return False
@@ -910,16 +1363,22 @@ def onCreated(**kwargs) -> None:
     restore_base_interface(**kwargs)
 
 
+def onDeleted(**kwargs) -> None:
+    """Called when node is deleted (HDA OnDeleted script)."""
+    node = kwargs.get("node")
+    if node:
+        _forget_node_asset_data(node)
+
+
 # --- accept_update ---
 
 def accept_update(**kwargs) -> None:
     """Accept pending update from Asset Watcher."""
-    import hou
+    hou = _hou_module()
     nu = _node_utils()
     node = kwargs.get("node") or hou.pwd()
     try:
-        from ftrack_houdini.asset_update_listener import accept_update as _accept_update
-        _accept_update(node=node)
+        _listener_module().accept_update(node=node)
     except Exception as e:
         logger.error("accept_update error: %s", e, exc_info=True)
         nu.set_parm(node, "log", "Accept update error: %s" % e)
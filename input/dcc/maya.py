@@ -18,10 +18,14 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger("ftrack_inout.input.dcc.maya")
 
+# Frame placeholders replaced by Maya's <f>: printf (%04d, %d) and hash (####)
+_PRINTF_FRAME_RE = re.compile(r'%0*\d*d')
+_HASH_FRAME_RE = re.compile(r'#+')
+
 
 def load_asset_version_data_for_maya(
     session: Any,
@@ -34,15 +38,15 @@ def load_asset_version_data_for_maya(
     Args:
         session: ftrack_api.Session
         asset_id: Ftrack asset ID
-        force_refresh: If True, query fresh from server
+        force_refresh: If True, query fresh from server (bypass adapter cache)
 
     Returns:
         Cached data dict from load_asset_version_component_data, or None.
     """
     if not session:
         return None
-    from ftrack_inout.input.core import load_asset_version_component_data
-    return load_asset_version_component_data(session, str(asset_id), force_refresh=force_refresh)
+    from ftrack_inout.input.core import load_asset_version_component_data_cached
+    return load_asset_version_component_data_cached(session, str(asset_id), force_refresh)
 
 
 def normalize_path_for_maya_frames(path: str) -> str:
@@ -63,8 +67,8 @@ def normalize_path_for_maya_frames(path: str) -> str:
     if not path:
         return path
     # Common patterns: %04d, %d, ####
-    path = re.sub(r'%0*(\d*)d', r'<f>', path)
-    path = re.sub(r'#+', r'<f>', path)
+    path = _PRINTF_FRAME_RE.sub('<f>', path)
+    path = _HASH_FRAME_RE.sub('<f>', path)
     return path
 
 
@@ -97,6 +101,24 @@ def resolve_component_path_maya(
     return path
 
 
+# Session source, resolved on the first get_session_for_maya() call:
+# common.session_factory.get_shared_session, or _own_session without it
+_session_factory: Optional[Callable[[], Optional[Any]]] = None
+_own_session: Optional[Any] = None
+
+
+def _get_own_session() -> Optional[Any]:
+    """Process-wide ftrack_api.Session, used when the session factory is unavailable."""
+    global _own_session
+    if _own_session is None:
+        try:
+            import ftrack_api
+            _own_session = ftrack_api.Session()
+        except Exception as e:
+            logger.warning("Failed to get Ftrack session: %s", e)
+    return _own_session
+
+
 def get_session_for_maya() -> Optional[Any]:
     """
     Get Ftrack session. Uses common session factory if available.
@@ -104,16 +126,14 @@ def get_session_for_maya() -> Optional[Any]:
     Returns:
         ftrack_api.Session or None
     """
-    try:
-        from ftrack_inout.common.session_factory import get_shared_session
-        return get_shared_session()
-    except ImportError:
+    global _session_factory
+    if _session_factory is None:
         try:
-            import ftrack_api
-            return ftrack_api.Session()
-        except Exception as e:
-            logger.warning("Failed to get Ftrack session: %s", e)
-            return None
+            from ftrack_inout.common.session_factory import get_shared_session
+            _session_factory = get_shared_session
+        except ImportError:
+            _session_factory = _get_own_session
+    return _session_factory()
 
 
 # --- Example usage (run from Maya script editor) ---
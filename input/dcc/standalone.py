@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from ftrack_inout.input.core import load_asset_version_component_data
+from ftrack_inout.input.core import load_asset_version_component_data_cached
 
 
 def load_asset_version_data_for_standalone(
@@ -22,7 +22,7 @@ def load_asset_version_data_for_standalone(
     Args:
         api_client: FtrackApiClient with get_session()
         asset_id: Ftrack asset ID
-        force_refresh: If True, query fresh from server (bypass relationship cache)
+        force_refresh: If True, query fresh from server (bypass relationship and adapter cache)
 
     Returns:
         Cached data dict from load_asset_version_component_data, or None.
@@ -31,4 +31,4 @@ def load_asset_version_data_for_standalone(
     session = get_session() if callable(get_session) else None
     if not session:
         return None
-    return load_asset_version_component_data(session, str(asset_id), force_refresh=force_refresh)
+    return load_asset_version_component_data_cached(session, str(asset_id), force_refresh)
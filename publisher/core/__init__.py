@@ -8,9 +8,15 @@ and can be reused across different DCC implementations.
 from .selector import (
     check_task_id,
     apply_task_id,
+    apply_task_id_async,
+    check_and_apply_task_id,
     apply_asset_params,
     get_assets_list,
     apply_name,
+    invalidate_task_cache,
+    resolve_tasks,
+    invalidate_existing_asset_cache,
+    TaskInfo,
 )
 
 from .publisher import (
@@ -32,9 +38,15 @@ __all__ = [
     # Selector functions
     'check_task_id',
     'apply_task_id',
+    'apply_task_id_async',
+    'check_and_apply_task_id',
     'apply_asset_params',
     'get_assets_list',
     'apply_name',
+    'invalidate_task_cache',
+    'resolve_tasks',
+    'invalidate_existing_asset_cache',
+    'TaskInfo',
     # Publisher classes
     'ComponentData',
     'PublishJob',
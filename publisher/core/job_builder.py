@@ -10,13 +10,29 @@ This module provides builders that collect data from:
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from typing import Any, Dict, List, Optional
 
 from .publisher import ComponentData, PublishJob
 
 _log = logging.getLogger(__name__)
 
+# Sequence indicators in one alternation, so a path is scanned once:
+# printf (%d, %0..), Houdini $F, Nuke @, Maya #{, and '#' only as frame
+# padding (surrounded by '.'/'_' or at the end - not a comment)
+_SEQ_RE = re.compile(r'%d|%0|\$F|@|#\{|[._]#+[._]|#$')
+# Every indicator above contains one of these; most paths have none
+_SEQ_CHARS = '%$@#'
+
+# Top-level widget parameters read by JobBuilder.from_qt_widget
+_WIDGET_PARAMS = [
+    'use_snapshot', 'use_playblast', 'playblast', 'components',
+    'thumbnail_path', 'transfer_target_location',
+    'p_task_id', 'p_asset_id', 'p_asset_name', 'p_asset_type', 'comment',
+]
+
 
 class JobBuilder:
     """Builds PublishJob from different sources."""
@@ -35,12 +51,19 @@ class JobBuilder:
         _log.info("[JobBuilder] Building PublishJob from Qt widget")
         
         components: List[ComponentData] = []
+        components_append = components.append
+        # Read all top-level parameters in one batch when the widget supports it
+        get_parameters = getattr(widget, 'get_parameters', None)
+        if get_parameters is not None:
+            get = get_parameters(_WIDGET_PARAMS).get
+        else:
+            get = widget.get_parameter
         
         # 1. Snapshot component
-        use_snapshot = widget.get_parameter('use_snapshot')
+        use_snapshot = get('use_snapshot')
         if use_snapshot:
             _log.debug("[JobBuilder] Adding snapshot component")
-            components.append(ComponentData(
+            components_append(ComponentData(
                 name='snapshot',
                 file_path=None,  # Will be created during real publish
                 component_type='snapshot',
@@ -50,11 +73,11 @@ class JobBuilder:
             ))
         
         # 2. Playblast component
-        use_playblast = widget.get_parameter('use_playblast')
+        use_playblast = get('use_playblast')
         if use_playblast:
-            playblast_path = widget.get_parameter('playblast') or ''
+            playblast_path = get('playblast') or ''
             _log.debug(f"[JobBuilder] Adding playblast component: {playblast_path}")
-            components.append(ComponentData(
+            components_append(ComponentData(
                 name='playblast',
                 file_path=playblast_path,
                 component_type='playblast',
@@ -64,70 +87,77 @@ class JobBuilder:
             ))
         
         # 3. File components from tabs
-        component_count = widget.get_parameter('components') or 0
+        component_count = get('components') or 0
         _log.debug(f"[JobBuilder] Processing {component_count} file components")
         
         # Access component tabs directly
-        if hasattr(widget, 'component_tabs'):
-            for i in range(widget.component_tabs.count()):
-                tab = widget.component_tabs.widget(i)
-                if tab and hasattr(tab, 'get_component_data'):
-                    comp_data = tab.get_component_data()
-                    idx = i + 1  # 1-based index (matches HDA parameter naming)
-                    
-                    # Read with indexed keys (comp_name1, file_path1, export1, etc.)
-                    comp_name = comp_data.get(f'comp_name{idx}', f'component_{idx}')
-                    file_path = comp_data.get(f'file_path{idx}', '')
-                    export_val = comp_data.get(f'export{idx}', 1)
-                    export_enabled = (export_val == 1 or export_val == True)
-                    transfer_after = comp_data.get(f'transfer_after_publish{idx}', 1)
-                    transfer_after_publish = (transfer_after == 1 or transfer_after is True)
+        component_tabs = getattr(widget, 'component_tabs', None)
+        if component_tabs is not None:
+            for i in range(component_tabs.count()):
+                tab = component_tabs.widget(i)
+                get_component_data = getattr(tab, 'get_component_data', None) if tab else None
+                if get_component_data is None:
+                    continue
+                cd_get = get_component_data().get
+                idx = i + 1  # 1-based index (matches HDA parameter naming)
+                
+                # Read with indexed keys (comp_name1, file_path1, export1, etc.);
+                # the index suffix is formatted once per tab
+                sfx = str(idx)
+                comp_name = cd_get('comp_name' + sfx, 'component_' + sfx)
+                file_path = cd_get('file_path' + sfx, '')
+                export_val = cd_get('export' + sfx, 1)
+                export_enabled = (export_val == 1 or export_val == True)
+                transfer_after = cd_get('transfer_after_publish' + sfx, 1)
+                transfer_after_publish = (transfer_after == 1 or transfer_after is True)
 
-                    # Collect metadata from component
-                    metadata = {'dcc': source_dcc}
-                    meta_count = comp_data.get(f'meta_count{idx}', 0)
-                    for m in range(1, meta_count + 1):
-                        key = comp_data.get(f'key{idx}_{m}', '')
-                        value = comp_data.get(f'value{idx}_{m}', '')
-                        if key:
-                            metadata[key] = value
-                    
-                    # Determine if it's a sequence
-                    component_type = 'file'
-                    sequence_pattern = None
-                    if file_path and _is_sequence_pattern(file_path):
-                        component_type = 'sequence'
-                        sequence_pattern = file_path
-                    
-                    _log.debug(
-                        f"[JobBuilder] Adding component {idx}: "
-                        f"name='{comp_name}', type='{component_type}', enabled={export_enabled}, "
-                        f"path='{file_path}'"
-                    )
-                    
-                    components.append(ComponentData(
-                        name=comp_name,
-                        file_path=file_path,
-                        component_type=component_type,
-                        export_enabled=export_enabled,
-                        metadata=metadata,
-                        sequence_pattern=sequence_pattern,
-                        transfer_after_publish=transfer_after_publish,
-                    ))
+                # Collect metadata from component (key1_1/value1_1, ...)
+                metadata = {'dcc': source_dcc}
+                meta_count = cd_get('meta_count' + sfx, 0)
+                key_prefix = 'key' + sfx + '_'
+                value_prefix = 'value' + sfx + '_'
+                for m in range(1, meta_count + 1):
+                    m_sfx = str(m)
+                    key = cd_get(key_prefix + m_sfx, '')
+                    if key:
+                        metadata[key] = cd_get(value_prefix + m_sfx, '')
+                
+                # Determine if it's a sequence
+                component_type = 'file'
+                sequence_pattern = None
+                if file_path and _is_sequence_pattern(file_path):
+                    component_type = 'sequence'
+                    sequence_pattern = file_path
+                
+                _log.debug(
+                    f"[JobBuilder] Adding component {idx}: "
+                    f"name='{comp_name}', type='{component_type}', enabled={export_enabled}, "
+                    f"path='{file_path}'"
+                )
+                
+                components_append(ComponentData(
+                    name=comp_name,
+                    file_path=file_path,
+                    component_type=component_type,
+                    export_enabled=export_enabled,
+                    metadata=metadata,
+                    sequence_pattern=sequence_pattern,
+                    transfer_after_publish=transfer_after_publish,
+                ))
 
         # Build PublishJob
-        thumbnail_path = widget.get_parameter('thumbnail_path') or None
+        thumbnail_path = get('thumbnail_path') or None
         if thumbnail_path:
             thumbnail_path = str(thumbnail_path).strip() or None
 
-        transfer_target_location = (widget.get_parameter('transfer_target_location') or '').strip() or None
+        transfer_target_location = (get('transfer_target_location') or '').strip() or None
 
         job = PublishJob(
-            task_id=widget.get_parameter('p_task_id') or '',
-            asset_id=widget.get_parameter('p_asset_id') or None,
-            asset_name=widget.get_parameter('p_asset_name') or None,
-            asset_type=widget.get_parameter('p_asset_type') or None,
-            comment=widget.get_parameter('comment') or '',
+            task_id=get('p_task_id') or '',
+            asset_id=get('p_asset_id') or None,
+            asset_name=get('p_asset_name') or None,
+            asset_type=get('p_asset_type') or None,
+            comment=get('comment') or '',
             components=components,
             thumbnail_path=thumbnail_path,
             source_dcc=source_dcc,
@@ -198,6 +228,7 @@ class JobBuilder:
             )
 
 
+@functools.lru_cache(maxsize=512)  # pure; AOVs often share one pattern
 def _is_sequence_pattern(path: str) -> bool:
     """Check if path contains sequence pattern.
     
@@ -211,25 +242,7 @@ def _is_sequence_pattern(path: str) -> bool:
     """
     if not path:
         return False
-    
-    sequence_indicators = [
-        '%d', '%0',           # printf style
-        '$F',                 # Houdini style
-        '@',                  # Nuke style
-        '#',                  # fileseq/Nuke style
-        '#{',                 # Maya/other style
-    ]
-    
-    # Check for indicators (but avoid false positives from # in other contexts)
-    for indicator in sequence_indicators:
-        if indicator in path:
-            # For '#' alone, make sure it's part of filename pattern (not a comment)
-            if indicator == '#':
-                # Check if # is surrounded by . or _ (typical sequence pattern)
-                import re
-                if re.search(r'[._]#+[._]', path) or path.endswith('#'):
-                    return True
-            else:
-                return True
-    
-    return False
+    # Cheap C-level 'in' scans rule out plain file paths before the regex
+    if not any(c in path for c in _SEQ_CHARS):
+        return False
+    return _SEQ_RE.search(path) is not None
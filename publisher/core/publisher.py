@@ -12,14 +12,104 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
+import sys
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+# Optional: faster PublishJob.to_json (C extension); stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _log = logging.getLogger(__name__)
 
+# Path is a sequence pattern (kept even if no file exists): '%', '@', or both
+# '[' and ']' (frame range) - one scan instead of up to four 'in' checks
+_SEQUENCE_PATH_RE = re.compile(r'[%@]|\[.*\]|\].*\[', re.DOTALL)
+
+# Upper bound for parallel os.path.exists checks (see _precheck_paths)
+_PATH_CHECK_WORKERS = 16
+
+
+def _precheck_paths(paths) -> Dict[str, bool]:
+    """os.path.exists for each distinct path, overlapped on a thread pool.
+
+    Each stat can take 10-200 ms on network shares; checking the components
+    of a job together costs roughly one stat instead of one per component.
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {path: os.path.exists(path) for path in unique}
+    with ThreadPoolExecutor(max_workers=min(_PATH_CHECK_WORKERS, len(unique))) as executor:
+        return dict(zip(unique, executor.map(os.path.exists, unique)))
+
+
+# Publisher(component_workers=None) reads its default from this variable.
+# Each worker session pays its own schema load, so threads only pay off for
+# several large uploads: serial (1) unless configured.
+COMPONENT_WORKERS_ENV = 'FTRACK_PUBLISH_COMPONENT_WORKERS'
+_MAX_COMPONENT_WORKERS = 8
+
+
+def _component_workers_from_env() -> int:
+    value = os.environ.get(COMPONENT_WORKERS_ENV, '').strip()
+    if not value:
+        return 1
+    try:
+        return int(value)
+    except ValueError:
+        _log.warning("[Publisher] Ignoring %s=%r (not an integer)", COMPONENT_WORKERS_ENV, value)
+        return 1
+
+
+# AssetType / User ids by (server_url, name). They are stable on the server, so
+# each is queried once per process; entities come back via session.get.
+_asset_type_ids: Dict[Tuple[str, str], str] = {}
+_user_ids: Dict[Tuple[str, str], str] = {}
+
+def _fast_new(cls, values: Dict[str, Any]):
+    """Instance of dataclass cls with values set directly, skipping __init__.
+
+    Used by the from_dict deserializers (hot when loading queued jobs);
+    values must cover every field of cls.
+    """
+    obj = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+# Slotted dataclasses (no per-instance __dict__) where supported: Python 3.10+.
+# DCC Pythons older than that get plain dataclasses.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a value for use inside a double-quoted ftrack query literal."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+# Query templates: the ftrack API has no bind variables, so every substitution
+# is listed here and filled with escaped values via str.format.
+_Q_ASSETS_BY_PARENT_AND_NAME = 'Asset where parent.id is "{parent_id}" and name like "{name}"'
+_Q_ASSET_TYPE_BY_NAME = 'AssetType where name is "{name}"'
+_Q_USER_BY_USERNAME = 'User where username is "{username}"'
+_Q_VERSION_WITH_ASSET = 'select asset from AssetVersion where id is "{version_id}"'
+_Q_COMPONENTS_BY_IDS = 'Component where id in ({ids})'
+
 
-@dataclass
+def _quoted_csv(values) -> str:
+    """'"a", "b"' - escaped, quoted values for an ftrack 'in (...)' clause."""
+    return ", ".join(f'"{_escape_query_value(v)}"' for v in values)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ComponentData:
     """Data for a single component to publish.
     
@@ -45,6 +135,25 @@ class ComponentData:
     # Transfer after publish (default on)
     transfer_after_publish: bool = True
 
+    # (file_path, normpath(file_path)) cache for normalized_path()
+    _normalized_path: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def normalized_path(self) -> Optional[str]:
+        """file_path with os.path.normpath applied (cached until file_path changes)."""
+        file_path = self.file_path
+        if not file_path:
+            return file_path
+        cached = self._normalized_path
+        if cached is None or cached[0] != file_path:
+            try:
+                normalized = os.path.normpath(file_path)
+            except Exception:
+                normalized = file_path
+            cached = self._normalized_path = (file_path, normalized)
+        return cached[1]
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization/logging."""
         return {
@@ -67,19 +176,20 @@ class ComponentData:
                 fr = (int(fr[0]), int(fr[1]))
             except (TypeError, ValueError):
                 fr = data.get('frame_range')
-        return cls(
-            name=data.get('name', ''),
-            file_path=data.get('file_path'),
-            component_type=data.get('component_type', 'file'),
-            export_enabled=data.get('export_enabled', True),
-            metadata=data.get('metadata', {}),
-            sequence_pattern=data.get('sequence_pattern'),
-            frame_range=fr,
-            transfer_after_publish=data.get('transfer_after_publish', True),
-        )
+        return _fast_new(cls, {
+            'name': data.get('name', ''),
+            'file_path': data.get('file_path'),
+            'component_type': data.get('component_type', 'file'),
+            'export_enabled': data.get('export_enabled', True),
+            'metadata': data.get('metadata', {}),
+            'sequence_pattern': data.get('sequence_pattern'),
+            'frame_range': fr,
+            'transfer_after_publish': data.get('transfer_after_publish', True),
+            '_normalized_path': None,
+        })
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PublishJob:
     """Complete publish request object.
     
@@ -99,7 +209,8 @@ class PublishJob:
             auto-generated thumbnail. Without playblast: sets preview. Not mutually exclusive with playblast.
         source_dcc: Source DCC name ('houdini', 'maya', 'standalone')
         source_scene: Path to source scene file
-        created_at: When this job was created
+        created_at: When this job was created; None until first needed
+            (see created_at_or_now), so deserialized jobs skip the clock read
     """
     task_id: str
     asset_id: Optional[str] = None
@@ -110,7 +221,7 @@ class PublishJob:
     thumbnail_path: Optional[str] = None
     source_dcc: str = "unknown"
     source_scene: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
 
     # Transfer after publish: target location name or id (empty = no transfer)
     transfer_target_location: Optional[str] = None
@@ -139,13 +250,12 @@ class PublishJob:
         if not self.asset_id and self.asset_name and not self.asset_type:
             self._validation_errors.append("asset_type is required when creating new asset")
         
-        # Check components
-        enabled_components = [c for c in self.components if c.export_enabled]
-        if not enabled_components:
-            self._validation_errors.append("No components enabled for publish")
-        
-        # Validate each enabled component
-        for comp in enabled_components:
+        # Validate each enabled component (single pass, counting enabled ones)
+        enabled_count = 0
+        for comp in self.components:
+            if not comp.export_enabled:
+                continue
+            enabled_count += 1
             if not comp.name:
                 self._validation_errors.append(f"Component has no name")
             
@@ -154,6 +264,8 @@ class PublishJob:
                 self._validation_errors.append(
                     f"Component '{comp.name}' has no file_path"
                 )
+        if not enabled_count:
+            self._validation_errors.append("No components enabled for publish")
         
         self._is_valid = len(self._validation_errors) == 0
         return self._is_valid, self._validation_errors
@@ -168,6 +280,13 @@ class PublishJob:
         """Get validation errors (call validate() first)."""
         return self._validation_errors
     
+    @property
+    def created_at_or_now(self) -> datetime:
+        """created_at, set to the current time on first access if still None."""
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        return self.created_at
+    
     @property
     def enabled_components(self) -> List[ComponentData]:
         """Get only enabled components."""
@@ -185,12 +304,18 @@ class PublishJob:
             'thumbnail_path': self.thumbnail_path,
             'source_dcc': self.source_dcc,
             'source_scene': self.source_scene,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at_or_now.isoformat(),
             'transfer_target_location': self.transfer_target_location,
         }
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        if orjson is not None and indent == 2:
+            # Same output as json.dumps(indent=2, ensure_ascii=False)
+            return orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode('utf-8')
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
     
     @classmethod
@@ -202,25 +327,25 @@ class PublishJob:
         created_at = data.get('created_at')
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
-        elif created_at is None:
-            created_at = datetime.now()
-        
-        return cls(
-            task_id=data.get('task_id', ''),
-            asset_id=data.get('asset_id'),
-            asset_name=data.get('asset_name'),
-            asset_type=data.get('asset_type'),
-            comment=data.get('comment', ''),
-            components=components,
-            thumbnail_path=data.get('thumbnail_path'),
-            source_dcc=data.get('source_dcc', 'unknown'),
-            source_scene=data.get('source_scene'),
-            created_at=created_at,
-            transfer_target_location=data.get('transfer_target_location'),
-        )
+        
+        return _fast_new(cls, {
+            'task_id': data.get('task_id', ''),
+            'asset_id': data.get('asset_id'),
+            'asset_name': data.get('asset_name'),
+            'asset_type': data.get('asset_type'),
+            'comment': data.get('comment', ''),
+            'components': components,
+            'thumbnail_path': data.get('thumbnail_path'),
+            'source_dcc': data.get('source_dcc', 'unknown'),
+            'source_scene': data.get('source_scene'),
+            'created_at': created_at,
+            'transfer_target_location': data.get('transfer_target_location'),
+            '_is_valid': False,
+            '_validation_errors': [],
+        })
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PublishResult:
     """Result of publish execution.
 
@@ -251,7 +376,17 @@ class PublishResult:
     timelog_seconds: float = 0.0
 
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
+        """Convert to dictionary.
+
+        Failed results carry only success and error_message; use
+        to_dict_full() when every key is needed regardless of outcome.
+        """
+        if not self.success:
+            return {'success': False, 'error_message': self.error_message}
+        return self.to_dict_full()
+
+    def to_dict_full(self) -> dict:
+        """Convert to dictionary with all fields."""
         return {
             'success': self.success,
             'error_message': self.error_message,
@@ -275,7 +410,13 @@ class Publisher:
     - dry_run=False: Actually publishes to Ftrack
     """
     
-    def __init__(self, session=None, dry_run: bool = True, auto_timelog: bool = True):
+    def __init__(
+        self,
+        session=None,
+        dry_run: bool = True,
+        auto_timelog: bool = True,
+        component_workers: Optional[int] = None,
+    ):
         """Initialize publisher.
 
         Args:
@@ -284,6 +425,10 @@ class Publisher:
             auto_timelog: If True, automatically create a timelog on successful publish.
                 Set to False when the caller handles time logging itself (e.g. Maya
                 batch publish with user-editable time dialog).
+            component_workers: Max threads for creating/uploading regular components
+                in parallel (each thread uses its own session). 1 = serial on the
+                main session; playblast encoding is always serial. None reads
+                FTRACK_PUBLISH_COMPONENT_WORKERS (default 1).
         """
         if session is None and not dry_run:
             try:
@@ -294,10 +439,13 @@ class Publisher:
             except ImportError:
                 pass
             except Exception as e:
-                _log.debug(f"[Publisher] Could not get shared session: {e}")
+                _log.debug("[Publisher] Could not get shared session: %s", e)
         self.session = session
         self.dry_run = dry_run
         self.auto_timelog = auto_timelog
+        if component_workers is None:
+            component_workers = _component_workers_from_env()
+        self.component_workers = max(1, min(int(component_workers), _MAX_COMPONENT_WORKERS))
     
     def execute(self, job: PublishJob) -> PublishResult:
         """Execute a publish job.
@@ -308,13 +456,13 @@ class Publisher:
         Returns:
             PublishResult with success/failure and created entities
         """
-        _log.info(f"[Publisher] execute() called, dry_run={self.dry_run}")
+        _log.info("[Publisher] execute() called, dry_run=%s", self.dry_run)
         
         # Validate job first
         is_valid, errors = job.validate()
         if not is_valid:
             error_msg = "Validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-            _log.error(f"[Publisher] {error_msg}")
+            _log.error("[Publisher] %s", error_msg)
             return PublishResult(success=False, error_message=error_msg)
         
         if self.dry_run:
@@ -325,55 +473,58 @@ class Publisher:
     def _execute_dry_run(self, job: PublishJob) -> PublishResult:
         """Dry run - just print what would be done."""
         separator = "=" * 70
+        # Report is collected and written once (one stdout write, no interleaving)
+        report: List[str] = []
+        emit = report.append
         
-        print(f"\n{separator}")
-        print("  DRY RUN - PublishJob Preview")
-        print(separator)
+        emit(f"\n{separator}")
+        emit("  DRY RUN - PublishJob Preview")
+        emit(separator)
         
         # Target info
-        print(f"\n{'Target:':<15}")
-        print(f"  Task ID:      {job.task_id}")
+        emit(f"\n{'Target:':<15}")
+        emit(f"  Task ID:      {job.task_id}")
         if job.asset_id:
-            print(f"  Asset ID:     {job.asset_id} (existing)")
+            emit(f"  Asset ID:     {job.asset_id} (existing)")
         else:
-            print(f"  Asset Name:   {job.asset_name} (NEW)")
-            print(f"  Asset Type:   {job.asset_type}")
+            emit(f"  Asset Name:   {job.asset_name} (NEW)")
+            emit(f"  Asset Type:   {job.asset_type}")
         
         # Context
-        print(f"\n{'Context:':<15}")
-        print(f"  Source DCC:   {job.source_dcc}")
-        print(f"  Scene:        {job.source_scene or '(not saved)'}")
-        print(f"  Comment:      {job.comment or '(no comment)'}")
-        print(f"  Thumbnail:    {job.thumbnail_path or '(none)'}")
+        emit(f"\n{'Context:':<15}")
+        emit(f"  Source DCC:   {job.source_dcc}")
+        emit(f"  Scene:        {job.source_scene or '(not saved)'}")
+        emit(f"  Comment:      {job.comment or '(no comment)'}")
+        emit(f"  Thumbnail:    {job.thumbnail_path or '(none)'}")
         transfer_target = getattr(job, 'transfer_target_location', None) or None
-        print(f"  Transfer to:  {transfer_target or '(no transfer)'}")
-        print(f"  Created at:   {job.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"  Transfer to:  {transfer_target or '(no transfer)'}")
+        emit(f"  Created at:   {job.created_at_or_now.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Components
         enabled = job.enabled_components
         disabled = [c for c in job.components if not c.export_enabled]
         
-        print(f"\n{'Components:':<15} ({len(enabled)} enabled, {len(disabled)} disabled)")
-        print("-" * 70)
+        emit(f"\n{'Components:':<15} ({len(enabled)} enabled, {len(disabled)} disabled)")
+        emit("-" * 70)
         
         for i, comp in enumerate(job.components, 1):
             status = "✓ ENABLED" if comp.export_enabled else "✗ DISABLED"
             transfer_after = getattr(comp, 'transfer_after_publish', True)
-            print(f"\n  [{i}] {comp.name}")
-            print(f"      Status:   {status}")
-            print(f"      Type:     {comp.component_type}")
-            print(f"      Path:     {comp.file_path or '(will be generated)'}")
-            print(f"      Transfer after publish: {'yes' if transfer_after else 'no'}")
+            emit(f"\n  [{i}] {comp.name}")
+            emit(f"      Status:   {status}")
+            emit(f"      Type:     {comp.component_type}")
+            emit(f"      Path:     {comp.normalized_path() or '(will be generated)'}")
+            emit(f"      Transfer after publish: {'yes' if transfer_after else 'no'}")
             if comp.sequence_pattern:
-                print(f"      Pattern:  {comp.sequence_pattern}")
+                emit(f"      Pattern:  {comp.sequence_pattern}")
             if comp.frame_range:
-                print(f"      Frames:   {comp.frame_range[0]} - {comp.frame_range[1]}")
+                emit(f"      Frames:   {comp.frame_range[0]} - {comp.frame_range[1]}")
             if comp.metadata:
-                print(f"      Metadata: {comp.metadata}")
+                emit(f"      Metadata: {comp.metadata}")
         
-        print(f"\n{separator}")
-        print("  Actions that would be performed:")
-        print(separator)
+        emit(f"\n{separator}")
+        emit("  Actions that would be performed:")
+        emit(separator)
         
         actions = []
         if job.asset_id:
@@ -385,11 +536,11 @@ class Publisher:
         
         for i, comp in enumerate(enabled, 1):
             if comp.component_type == 'snapshot':
-                actions.append(f"3.{i}. Create 'snapshot' component from: {comp.file_path}")
+                actions.append(f"3.{i}. Create 'snapshot' component from: {comp.normalized_path()}")
             elif comp.component_type == 'playblast':
-                actions.append(f"3.{i}. Encode media: {comp.file_path}")
+                actions.append(f"3.{i}. Encode media: {comp.normalized_path()}")
             else:
-                actions.append(f"3.{i}. Create component '{comp.name}' from: {comp.file_path}")
+                actions.append(f"3.{i}. Create component '{comp.name}' from: {comp.normalized_path()}")
         
         if job.thumbnail_path:
             actions.append(f"4. Set version thumbnail from: {job.thumbnail_path}")
@@ -406,18 +557,23 @@ class Publisher:
             actions.append(f"7. (No transfer target set)")
         
         for action in actions:
-            print(f"  {action}")
+            emit(f"  {action}")
         
-        print(f"\n{separator}")
-        print("  DRY RUN COMPLETE - No changes made")
-        print(f"{separator}\n")
+        emit(f"\n{separator}")
+        emit("  DRY RUN COMPLETE - No changes made")
+        emit(f"{separator}\n")
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
         
-        # Return mock result
-        mock_component_ids = [f"mock-comp-{i}" for i in range(len(enabled))]
-        mock_paths = {
-            f"mock-comp-{i}": comp.file_path or f"(snapshot-path-{i})"
-            for i, comp in enumerate(enabled)
-        }
+        # Return mock result (ids, paths and component entries in one pass)
+        mock_component_ids = []
+        mock_paths = {}
+        created_components = []
+        for i, comp in enumerate(enabled):
+            cid = f"mock-comp-{i}"
+            mock_component_ids.append(cid)
+            mock_paths[cid] = comp.normalized_path() or f"(snapshot-path-{i})"
+            created_components.append({'name': comp.name, 'type': comp.component_type, 'id': cid})
         
         return PublishResult(
             success=True,
@@ -427,16 +583,130 @@ class Publisher:
             asset_name=job.asset_name or "(existing asset)",
             component_ids=mock_component_ids,
             component_paths=mock_paths,
-            created_components=[
-                {'name': comp.name, 'type': comp.component_type, 'id': f'mock-comp-{i}'}
-                for i, comp in enumerate(enabled)
-            ]
+            created_components=created_components,
         )
     
+    def _get_asset_type(self, name: str):
+        """AssetType entity by name (id cached per server)."""
+        session = self.session
+        key = (getattr(session, 'server_url', ''), name)
+        type_id = _asset_type_ids.get(key)
+        if type_id is not None:
+            asset_type = session.get('AssetType', type_id)
+            if asset_type:
+                return asset_type
+        asset_type = session.query(
+            _Q_ASSET_TYPE_BY_NAME.format(name=_escape_query_value(name))
+        ).one()
+        _asset_type_ids[key] = asset_type['id']
+        return asset_type
+    
+    def _get_api_user(self):
+        """User entity of session.api_user (id cached per server), or None."""
+        session = self.session
+        api_user = session.api_user
+        key = (getattr(session, 'server_url', ''), api_user)
+        user_id = _user_ids.get(key)
+        if user_id is not None:
+            user = session.get('User', user_id)
+            if user:
+                return user
+        # User lookup by username - query required (no get by username)
+        user = session.query(
+            _Q_USER_BY_USERNAME.format(username=_escape_query_value(api_user))
+        ).first()
+        if user:
+            _user_ids[key] = user['id']
+        return user
+    
+    @staticmethod
+    def _create_one_component(asset_version, comp: ComponentData, file_path: Optional[str]):
+        """Create one component on asset_version (location='auto') and return it."""
+        # Metadata is only read by create_component - pass it through uncopied
+        metadata = comp.metadata or {}
+        
+        info_enabled = _log.isEnabledFor(logging.INFO)
+        if info_enabled:
+            _log.info("[Publisher] Creating component: %s, path: %s", comp.name, file_path)
+        
+        comp_entity = asset_version.create_component(
+            file_path,
+            data={
+                'name': comp.name,
+                'metadata': metadata
+            },
+            location='auto'
+        )
+        if info_enabled:
+            _log.info("[Publisher] Component created: %s", comp_entity['id'])
+        return comp_entity
+    
+    def _create_components_parallel(
+        self,
+        asset_version,
+        pending: List[Tuple[int, ComponentData, Optional[str]]],
+    ) -> Optional[Dict[int, Tuple[Any, Optional[str]]]]:
+        """Create regular components on worker threads (uploads overlap).
+        
+        Sessions are not thread-safe, so each worker thread creates the
+        components on its own session; the main session then loads them by id.
+        Failed components are logged and left out, as in the serial path.
+        
+        Returns:
+            {enabled index: (component entity on self.session, file_path)},
+            or None if worker sessions are not available (caller goes serial)
+        """
+        import threading
+        try:
+            from ...common.session_factory import create_worker_session
+        except ImportError:
+            _log.warning("[Publisher] session_factory not available, creating components serially")
+            return None
+        
+        version_id = asset_version['id']
+        local = threading.local()
+        worker_sessions = []
+        lock = threading.Lock()
+        
+        def create(comp, file_path):
+            worker_session = getattr(local, 'session', None)
+            if worker_session is None:
+                worker_session = create_worker_session()
+                if worker_session is None:
+                    raise RuntimeError("Could not create worker session")
+                local.session = worker_session
+                with lock:
+                    worker_sessions.append(worker_session)
+            version = worker_session.get('AssetVersion', version_id)
+            return self._create_one_component(version, comp, file_path)['id']
+        
+        results = {}
+        max_workers = min(self.component_workers, len(pending))
+        _log.info("[Publisher] Creating %s components on %s threads", len(pending), max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FtPublishComponent") as executor:
+                futures = {
+                    executor.submit(create, comp, file_path): (enabled_idx, comp, file_path)
+                    for enabled_idx, comp, file_path in pending
+                }
+                # Results are handled here on the calling thread, the only
+                # one that touches self.session
+                for future in as_completed(futures):
+                    enabled_idx, comp, file_path = futures[future]
+                    try:
+                        results[enabled_idx] = (self.session.get('Component', future.result()), file_path)
+                    except Exception as comp_error:
+                        _log.error("[Publisher] Failed to create component %s: %s", comp.name, comp_error, exc_info=True)
+        finally:
+            for worker_session in worker_sessions:
+                try:
+                    worker_session.close()
+                except Exception:
+                    pass
+        return results
+    
     def _execute_real(self, job: PublishJob) -> PublishResult:
         """Real execution - publish to Ftrack."""
-        import os
-        
         if not self.session:
             return PublishResult(
                 success=False,
@@ -444,6 +714,9 @@ class Publisher:
             )
         
         _log.info("[Publisher] Starting real publish...")
+        # Per-component progress logs are skipped outright below INFO
+        # (level assumed constant for the duration of a publish)
+        info_enabled = _log.isEnabledFor(logging.INFO)
         session = self.session
         session.reset()  # Clear any stale dirty state from a previous failed publish
 
@@ -451,52 +724,55 @@ class Publisher:
             # ---------------------------------------------------------------
             # 1. Get Task (use session.get for cache)
             # ---------------------------------------------------------------
-            _log.info(f"[Publisher] Fetching task: {job.task_id}")
+            _log.info("[Publisher] Fetching task: %s", job.task_id)
             task = session.get('Task', job.task_id)
             if not task:
                 return PublishResult(success=False, error_message=f"Task not found: {job.task_id}")
             asset_parent = task['parent']
-            _log.info(f"[Publisher] Task: {task['name']}, Parent: {asset_parent['name']}")
+            _log.info("[Publisher] Task: %s, Parent: %s", task['name'], asset_parent['name'])
             
             # ---------------------------------------------------------------
             # 2. Get or Create Asset
             # ---------------------------------------------------------------
             asset = None
+            asset_created = False
             
             if job.asset_id:
                 # Use existing asset (session.get uses cache)
-                _log.info(f"[Publisher] Using existing asset: {job.asset_id}")
+                _log.info("[Publisher] Using existing asset: %s", job.asset_id)
                 asset = session.get('Asset', job.asset_id)
                 if not asset:
                     return PublishResult(success=False, error_message=f"Asset not found: {job.asset_id}")
             else:
                 # Check if asset with this name already exists (case-insensitive)
-                _log.info(f"[Publisher] Checking if asset '{job.asset_name}' exists...")
+                _log.info("[Publisher] Checking if asset '%s' exists...", job.asset_name)
                 
-                existing_assets = session.query(
-                    f"Asset where parent.id is '{asset_parent['id']}'"
-                ).all()
+                # Let the server narrow siblings down to name matches ('like' is
+                # case-insensitive); '_'/'%' are wildcards there, so re-check here.
+                existing_assets = session.query(_Q_ASSETS_BY_PARENT_AND_NAME.format(
+                    parent_id=_escape_query_value(asset_parent['id']),
+                    name=_escape_query_value(job.asset_name),
+                )).all()
                 
                 name_lower = job.asset_name.lower()
                 for existing in existing_assets:
                     if existing['name'].lower() == name_lower:
                         asset = existing
-                        _log.info(f"[Publisher] Found existing asset: {asset['name']} ({asset['id']})")
+                        _log.info("[Publisher] Found existing asset: %s (%s)", asset['name'], asset['id'])
                         break
                 
                 if asset is None:
                     # Create new asset
-                    _log.info(f"[Publisher] Creating new asset: {job.asset_name} (type: {job.asset_type})")
+                    _log.info("[Publisher] Creating new asset: %s (type: %s)", job.asset_name, job.asset_type)
                     
-                    asset_type = session.query(
-                        f'AssetType where name is "{job.asset_type}"'
-                    ).one()
+                    asset_type = self._get_asset_type(job.asset_type)
                     
                     asset = session.create('Asset', {
                         'name': job.asset_name,
                         'type': asset_type,
                         'parent': asset_parent
                     })
+                    asset_created = True
             
             # ---------------------------------------------------------------
             # 3. Create AssetVersion
@@ -513,106 +789,108 @@ class Publisher:
             # Commit to get version number
             _log.info("[Publisher] Initial commit...")
             session.commit()
+            if asset_created:
+                # The selector caches "asset exists in parent" lookups
+                from .selector import invalidate_existing_asset_cache
+                invalidate_existing_asset_cache()
             
             version_number = asset_version['version']
-            _log.info(f"[Publisher] Created version {version_number}")
+            _log.info("[Publisher] Created version %s", version_number)
             
             # Create Note for comment (ftrack uses Notes, not comment field)
             if job.comment:
                 try:
-                    api_user = session.api_user
-                    # User lookup by username - query required (no get by username)
-                    user = session.query(f'User where username is "{api_user}"').first()
+                    user = self._get_api_user()
                     if user:
                         asset_version.create_note(job.comment, author=user)
-                        _log.info(f"[Publisher] Created note: {job.comment[:50]}...")
+                        _log.info("[Publisher] Created note: %s...", job.comment[:50])
                     else:
-                        _log.warning(f"[Publisher] Could not find user '{api_user}' for note author")
+                        _log.warning("[Publisher] Could not find user '%s' for note author", session.api_user)
                 except Exception as note_err:
-                    _log.warning(f"[Publisher] Failed to create note: {note_err}")
+                    _log.warning("[Publisher] Failed to create note: %s", note_err)
             
             # ---------------------------------------------------------------
             # 4. Create Components
             # ---------------------------------------------------------------
-            created_components = []
-            component_ids = []
-            component_paths = {}
-            enabled_indices_for_created = []  # index in job.enabled_components for each created
+            # {enabled index: (component entity, file_path)} - results are
+            # collected by index so order matches the job even when regular
+            # components are created in parallel.
+            results: Dict[int, Tuple[Any, str]] = {}
+            pending = []  # regular components: (enabled_idx, comp, file_path)
+            enabled_components = job.enabled_components
 
-            for enabled_idx, comp in enumerate(job.enabled_components):
-                _log.info(f"[Publisher] Processing component: {comp.name} ({comp.component_type})")
+            # Existence of plain (non-sequence) regular component files is
+            # checked up front, in parallel
+            path_exists = _precheck_paths(
+                path for path in (
+                    comp.normalized_path() for comp in enabled_components
+                    if comp.component_type != 'playblast'
+                )
+                if path and _SEQUENCE_PATH_RE.search(path) is None
+            )
+
+            for enabled_idx, comp in enumerate(enabled_components):
+                if info_enabled:
+                    _log.info("[Publisher] Processing component: %s (%s)", comp.name, comp.component_type)
                 
-                try:
-                    comp_entity = None
-                    
-                    if comp.component_type == 'playblast':
-                        # Playblast: encode for ftrack web review AND store as a file component
-                        if comp.file_path:
-                            file_path = os.path.normpath(comp.file_path)
-                            _log.info(f"[Publisher] Encoding media: {file_path}")
-                            asset_version.encode_media(file_path)
-                            try:
-                                session.commit()
-                            except Exception as ce:
-                                _log.warning(f"[Publisher] Commit after encode_media: {ce}")
-
-                            # Also store playblast as a regular file component in the location
-                            _log.info(f"[Publisher] Storing playblast as file component: {file_path}")
-                            metadata = dict(comp.metadata) if comp.metadata else {}
-                            comp_entity = asset_version.create_component(
-                                file_path,
-                                data={'name': comp.name, 'metadata': metadata},
-                                location='auto',
-                            )
-                            created_components.append(comp_entity)
-                            component_ids.append(comp_entity['id'])
-                            component_paths[comp_entity['id']] = file_path
-                            _log.info(f"[Publisher] Playblast component created: {comp_entity['id']}")
+                if comp.component_type == 'playblast':
+                    # Playblast: encode for ftrack web review AND store as a file component.
+                    # Stays serial on the main session (encode_media commits server-side).
+                    if not comp.file_path:
                         continue
-                    
-                    else:
-                        # Regular component (snapshot, file, sequence)
-                        file_path = comp.file_path
-                        if file_path:
-                            try:
-                                file_path = os.path.normpath(file_path)
-                            except Exception:
-                                pass
-                        
-                        # Skip missing files (unless it's a sequence pattern)
-                        if file_path:
-                            is_sequence = (
-                                '%' in file_path or 
-                                '@' in file_path or 
-                                ('[' in file_path and ']' in file_path)
-                            )
-                            if not is_sequence and not os.path.exists(file_path):
-                                _log.warning(f"[Publisher] File not found, skipping: {file_path}")
-                                continue
-                        
-                        # Prepare metadata
-                        metadata = dict(comp.metadata) if comp.metadata else {}
-                        
-                        _log.info(f"[Publisher] Creating component: {comp.name}, path: {file_path}")
-                        
-                        comp_entity = asset_version.create_component(
-                            file_path,
-                            data={
-                                'name': comp.name,
-                                'metadata': metadata
-                            },
-                            location='auto'
-                        )
-                        
-                        created_components.append(comp_entity)
-                        component_ids.append(comp_entity['id'])
-                        component_paths[comp_entity['id']] = file_path
-                        enabled_indices_for_created.append(enabled_idx)
+                    try:
+                        file_path = comp.normalized_path()
+                        _log.info("[Publisher] Encoding media: %s", file_path)
+                        asset_version.encode_media(file_path)
+                        try:
+                            session.commit()
+                        except Exception as ce:
+                            _log.warning("[Publisher] Commit after encode_media: %s", ce)
 
-                        _log.info(f"[Publisher] Component created: {comp_entity['id']}")
+                        # Also store playblast as a regular file component in the location
+                        _log.info("[Publisher] Storing playblast as file component: %s", file_path)
+                        comp_entity = self._create_one_component(asset_version, comp, file_path)
+                        results[enabled_idx] = (comp_entity, file_path)
+                    except Exception as comp_error:
+                        _log.error("[Publisher] Failed to create component %s: %s", comp.name, comp_error, exc_info=True)
+                    continue
+
+                # Regular component (snapshot, file, sequence)
+                file_path = comp.normalized_path()
+                
+                # Skip missing files (sequence patterns are not in path_exists)
+                if file_path and not path_exists.get(file_path, True):
+                    _log.warning("[Publisher] File not found, skipping: %s", file_path)
+                    continue
                 
-                except Exception as comp_error:
-                    _log.error(f"[Publisher] Failed to create component {comp.name}: {comp_error}", exc_info=True)
+                pending.append((enabled_idx, comp, file_path))
+
+            parallel_results = None
+            if self.component_workers > 1 and len(pending) > 1:
+                parallel_results = self._create_components_parallel(asset_version, pending)
+            if parallel_results is not None:
+                results.update(parallel_results)
+            else:
+                for enabled_idx, comp, file_path in pending:
+                    try:
+                        comp_entity = self._create_one_component(asset_version, comp, file_path)
+                        results[enabled_idx] = (comp_entity, file_path)
+                    except Exception as comp_error:
+                        _log.error("[Publisher] Failed to create component %s: %s", comp.name, comp_error, exc_info=True)
+
+            created_components = []
+            component_ids = []
+            component_paths = {}
+            # Index in enabled_components for each created component, playblasts
+            # included: transfer-after-publish reads each component's own
+            # transfer_after_publish flag through it
+            enabled_indices_for_created = []
+            for enabled_idx in sorted(results):
+                comp_entity, file_path = results[enabled_idx]
+                created_components.append(comp_entity)
+                component_ids.append(comp_entity['id'])
+                component_paths[comp_entity['id']] = file_path
+                enabled_indices_for_created.append(enabled_idx)
             
             # ---------------------------------------------------------------
             # 4b. Set Version Thumbnail (optional)
@@ -624,13 +902,13 @@ class Publisher:
                 thumb_path = os.path.normpath(job.thumbnail_path)
                 if os.path.exists(thumb_path):
                     try:
-                        _log.info(f"[Publisher] Setting version thumbnail: {thumb_path}")
+                        _log.info("[Publisher] Setting version thumbnail: %s", thumb_path)
                         asset_version.create_thumbnail(thumb_path)
                         _log.info("[Publisher] Thumbnail set successfully")
                     except Exception as thumb_err:
-                        _log.warning(f"[Publisher] Failed to set thumbnail (non-critical): {thumb_err}")
+                        _log.warning("[Publisher] Failed to set thumbnail (non-critical): %s", thumb_err)
                 else:
-                    _log.warning(f"[Publisher] Thumbnail file not found, skipping: {thumb_path}")
+                    _log.warning("[Publisher] Thumbnail file not found, skipping: %s", thumb_path)
             
             # ---------------------------------------------------------------
             # 5. Update asset metadata list for latest published components
@@ -638,15 +916,23 @@ class Publisher:
             _log.info("[Publisher] Updating asset metadata latest_published_list...")
             try:
                 latest_published_key = "latest_published_list"
-                asset_meta = asset.get('metadata') or {}
-                if not isinstance(asset_meta, dict):
+                asset_meta = asset.get('metadata')
+                # ftrack's metadata proxy records per-key operations: update it
+                # in place so the commit carries only changed keys. Anything
+                # else is copied to a dict and assigned back at the end.
+                meta_in_place = (
+                    isinstance(asset_meta, MutableMapping)
+                    and not isinstance(asset_meta, dict)
+                )
+                if not meta_in_place:
                     try:
-                        asset_meta = dict(asset_meta)
+                        asset_meta = dict(asset_meta or {})
                     except Exception:
                         asset_meta = {}
 
                 # Keep a JSON map: {"component.ext": "<component_id>", ...}
                 # under one dedicated metadata key instead of flat root pairs.
+                latest_published_raw = None
                 try:
                     latest_published_raw = asset_meta.get(latest_published_key)
                     latest_published_list = (
@@ -699,14 +985,19 @@ class Publisher:
                                 comp_id
                             )
                     except Exception as _e:
-                        _log.warning(f"[Publisher] Failed to update asset metadata for component: {_e}")
+                        _log.warning("[Publisher] Failed to update asset metadata for component: %s", _e)
 
                 # Remove legacy flat pairs from root metadata after migration.
                 for legacy_key in legacy_keys_to_remove:
                     asset_meta.pop(legacy_key, None)
 
-                asset_meta[latest_published_key] = json.dumps(latest_published_list)
-                asset['metadata'] = asset_meta
+                latest_published_new = json.dumps(latest_published_list)
+                meta_changed = bool(legacy_keys_to_remove)
+                if latest_published_new != latest_published_raw:
+                    asset_meta[latest_published_key] = latest_published_new
+                    meta_changed = True
+                if meta_changed and not meta_in_place:
+                    asset['metadata'] = asset_meta
                 if migrated_legacy:
                     _log.info(
                         "[Publisher] Migrated %d legacy metadata pair(s) into %s: %s",
@@ -726,7 +1017,7 @@ class Publisher:
                     updated_keys
                 )
             except Exception as _e:
-                _log.warning(f"[Publisher] Failed to update latest_published_list metadata: {_e}")
+                _log.warning("[Publisher] Failed to update latest_published_list metadata: %s", _e)
             
             # ---------------------------------------------------------------
             # 6. Final Commit
@@ -735,16 +1026,18 @@ class Publisher:
             session.commit()
             
             # Update cache: load new entities so cache is warm for browser/finput
+            # (one query for version + asset, one for all components)
             try:
-                _ = session.get('AssetVersion', asset_version['id'])
-                for cid in component_ids:
-                    session.get('Component', cid)
-                session.get('Asset', asset['id'])
+                session.query(_Q_VERSION_WITH_ASSET.format(
+                    version_id=_escape_query_value(asset_version['id'])
+                )).all()
+                if component_ids:
+                    session.query(_Q_COMPONENTS_BY_IDS.format(ids=_quoted_csv(component_ids))).all()
                 _log.debug("[Publisher] Cache updated with new version/components/asset")
             except Exception as cache_err:
-                _log.debug(f"[Publisher] Cache warm-up (non-critical): {cache_err}")
+                _log.debug("[Publisher] Cache warm-up (non-critical): %s", cache_err)
             
-            _log.info(f"[Publisher] Publish complete! Version {version_number}, {len(created_components)} components")
+            _log.info("[Publisher] Publish complete! Version %s, %s components", version_number, len(created_components))
 
             # ---------------------------------------------------------------
             # 7. Auto-timelog
@@ -761,9 +1054,9 @@ class Publisher:
                         comment="Auto-logged on publish",
                     )
                     if timelog_id:
-                        _log.info(f"[Publisher] Timelog created: {timelog_id} ({per_task_secs:.0f}s)")
+                        _log.info("[Publisher] Timelog created: %s (%.0fs)", timelog_id, per_task_secs)
                 except Exception as tl_err:
-                    _log.warning(f"[Publisher] Auto-timelog failed (non-critical): {tl_err}")
+                    _log.warning("[Publisher] Auto-timelog failed (non-critical): %s", tl_err)
 
             # ---------------------------------------------------------------
             # 8. Transfer after publish (optional, per-component)
@@ -792,16 +1085,15 @@ class Publisher:
                             transfer_target,
                         )
                     else:
-                        enabled = job.enabled_components
                         created = 0
-                        for i, comp_id in enumerate(component_ids):
-                            enab_idx = enabled_indices_for_created[i] if i < len(enabled_indices_for_created) else i
-                            if enab_idx >= len(enabled) or not getattr(enabled[enab_idx], 'transfer_after_publish', True):
+                        for comp_entity, enabled_idx in zip(created_components, enabled_indices_for_created):
+                            if not getattr(enabled_components[enabled_idx], 'transfer_after_publish', True):
                                 continue
+                            comp_id = comp_entity['id']
                             from_loc_id = get_component_location_id(session, comp_id)
                             if not from_loc_id:
                                 continue
-                            comp_label = created_components[i].get("name", "") if i < len(created_components) else ""
+                            comp_label = comp_entity.get("name", "")
                             jid = create_transfer_job(
                                 session,
                                 comp_id,
@@ -838,7 +1130,7 @@ class Publisher:
             )
             
         except Exception as e:
-            _log.error(f"[Publisher] Publish failed: {e}", exc_info=True)
+            _log.error("[Publisher] Publish failed: %s", e, exc_info=True)
             return PublishResult(
                 success=False,
                 error_message=str(e)
@@ -6,14 +6,22 @@ that work with any parameter interface (Houdini HDA, Maya node, Qt widget, etc.)
 
 All functions accept a parameter interface object that provides:
 - get_parameter(name: str) -> Any
+- get_parameters(names: List[str]) -> Dict[str, Any] (optional, batched reads)
 - set_parameter(name: str, value: Any) -> None
+- set_parameters(updates: Dict[str, Any]) -> None (optional, batched writes)
 - show_message(message: str, severity: str = "info") -> None (optional)
 """
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -27,6 +35,8 @@ except ImportError:
     FTRACK_AVAILABLE = False
     ftrack_api = None  # type: ignore
 
+from .publisher import _escape_query_value
+
 _log = logging.getLogger(__name__)
 
 
@@ -38,10 +48,18 @@ if TYPE_CHECKING:
             """Get parameter value by name."""
             ...
         
+        def get_parameters(self, names: List[str]) -> Dict[str, Any]:
+            """Get several parameter values in one batch (optional)."""
+            ...
+        
         def set_parameter(self, name: str, value: Any) -> None:
             """Set parameter value by name."""
             ...
         
+        def set_parameters(self, updates: Dict[str, Any]) -> None:
+            """Set several parameters in one batch (optional)."""
+            ...
+        
         def show_message(self, message: str, severity: str = "info") -> None:
             """Show message to user (optional)."""
             ...
@@ -49,10 +67,268 @@ else:
     ParameterInterface = object
 
 
+# Query templates: the ftrack API has no bind variables, so every substitution
+# is listed here and filled with escaped values by _expr.
+# {task_ids} is a list of quoted literals, built by resolve_tasks
+_Q_TASKS_PROJECTED = (
+    'select name, parent.name, parent.id, parent.project.name, parent.project.id '
+    'from Task where id in ({task_ids})'
+)
+_Q_ASSET_PROJECTED = (
+    'select name, type.name, parent.name, parent.id, parent.project.name, parent.project.id '
+    'from Asset where id is "{asset_id}"'
+)
+_Q_ASSET_BY_NAME_AND_PARENT = (
+    'select name, type.name, parent.name, parent.project.name '
+    'from Asset where name is "{name}" and parent.id is "{parent_id}"'
+)
+# 'new_asset' placeholders are never selectable (apply_name ignores them)
+_Q_ASSETS_BY_PARENT = (
+    'select name, type.name from Asset '
+    'where parent.id is "{parent_id}" and name is_not "new_asset"'
+)
+_Q_ASSET_NAME_TYPE = 'select name, type.name from Asset where id is "{asset_id}"'
+_Q_ID_BY_NAME_AND_PARENT = (
+    'select id from {entity_type} where name is "{name}" and parent.id is "{parent_id}" limit 1'
+)
+
+
+def _expr(template: str, **values: Any) -> str:
+    """template.format(**values) with every value escaped for a quoted literal."""
+    return template.format(**{k: _escape_query_value(v) for k, v in values.items()})
+
+
+def _query(session: Any, template: str, **values: Any):
+    """session.query on a _Q_* template filled by _expr.
+
+    ftrack_api has no bind variables, so escaping is the only safe way to
+    put names (which may contain quotes) into a query.
+    """
+    return session.query(_expr(template, **values))
+
+
+def _s(value: Any) -> str:
+    """Parameter value as a stripped string ('' for None)."""
+    if isinstance(value, str):
+        return value.strip()
+    return '' if value is None else str(value).strip()
+
+
+def _requires_session(default: Callable[[], Any] = lambda: False):
+    """Return default() without touching params when the session argument is falsy.
+
+    Keeps the "no session" path free of DCC parameter reads and writes.
+    """
+    def decorator(fn):
+        index = list(inspect.signature(fn).parameters).index('session')
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            session = args[index] if index < len(args) else kwargs.get('session')
+            if not session:
+                _log.warning("[%s] Ftrack session is not available", fn.__name__)
+                return default()
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _get_parameters(params: Any, names: List[str]) -> Dict[str, Any]:
+    """Read names with one params.get_parameters call when supported."""
+    get_parameters = getattr(params, 'get_parameters', None)
+    if get_parameters is not None:
+        return get_parameters(names)
+    return {name: params.get_parameter(name) for name in names}
+
+
+def _set_param(params: Any, name: str, value: Any) -> None:
+    """params.set_parameter, logging (not raising) a failed write."""
+    try:
+        params.set_parameter(name, value)
+    except Exception as e:
+        _log.warning("[selector] Failed to set '%s': %s", name, e)
+
+
+def _set_parameters(params: Any, updates: Dict[str, Any]) -> None:
+    """Write updates with one params.set_parameters call when supported.
+
+    Interfaces without set_parameters (or a failing batch) get one
+    set_parameter per entry, in order; a failed write is logged and skipped.
+    """
+    set_parameters = getattr(params, 'set_parameters', None)
+    if set_parameters is not None:
+        try:
+            set_parameters(updates)
+            return
+        except Exception as e:
+            _log.warning("[selector] Batched parameter write failed, setting one by one: %s", e)
+    debug = _log.isEnabledFor(logging.DEBUG)
+    for parm_name, value in updates.items():
+        if debug:
+            _log.debug("[selector] Setting parameter '%s' = '%s'", parm_name, value)
+        _set_param(params, parm_name, value)
+
+
+def _changed_only(updates: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """The entries of updates whose value differs from current.
+
+    Names missing from current are always kept (e.g. p_task_id, which
+    the Qt UI aliases to task_Id and whose label only refreshes on write).
+    """
+    return {
+        name: value for name, value in updates.items()
+        if name not in current or current[name] != value
+    }
+
+
+@dataclass(frozen=True)
+class TaskInfo:
+    """Resolved task -> parent -> project names and ids."""
+    task_id: str
+    task_name: str
+    parent_id: str
+    parent_name: str
+    project_id: str
+    project_name: str
+
+
+# Errors expected from ftrack lookups: server/query errors (including no
+# result), network failures (requests' ConnectionError/Timeout derive from
+# OSError, as do socket errors), missing attributes and entities that
+# resolved to None. These callbacks run inside Houdini/Qt, so none of these
+# may escape them.
+_LOOKUP_ERRORS: Tuple[type, ...] = (OSError, KeyError, TypeError, AttributeError)
+if FTRACK_AVAILABLE:
+    _LOOKUP_ERRORS = (ftrack_api.exception.Error,) + _LOOKUP_ERRORS
+
+# Resolved tasks keyed by (id(session), task_id). Selector callbacks fire on
+# every parameter change, so the same task would otherwise be re-queried.
+_TASK_CACHE_MAX = 128
+_task_cache: Dict[Tuple[int, str], TaskInfo] = {}
+
+# Guards _task_cache and _existing_asset_cache: apply_task_id_async fills
+# them from its worker thread while UI callbacks read and invalidate them.
+# Held for dict operations only, never across a query.
+_cache_lock = threading.Lock()
+
+
+def _resolve_task(session: Any, task_id: str) -> TaskInfo:
+    """Return TaskInfo for task_id, querying ftrack only on a cache miss.
+
+    Raises:
+        KeyError: If there is no Task with that id
+    """
+    info = resolve_tasks(session, [task_id]).get(task_id)
+    if info is None:
+        raise KeyError(f"Task not found: {task_id}")
+    return info
+
+
+def resolve_tasks(session: Any, task_ids: List[str]) -> Dict[str, TaskInfo]:
+    """
+    TaskInfo for several task ids, with one ftrack query for all cache misses.
+
+    For UIs previewing many selections at once (breadcrumbs, thumbnails).
+    
+    Args:
+        session: Ftrack session
+        task_ids: Task IDs (duplicates are looked up once)
+    
+    Returns:
+        Dict {task_id: TaskInfo}; ids with no Task are left out
+    """
+    session_key = id(session)
+    result: Dict[str, TaskInfo] = {}
+    missing: List[str] = []
+    with _cache_lock:
+        for task_id in dict.fromkeys(task_ids):
+            info = _task_cache.get((session_key, task_id))
+            if info is not None:
+                result[task_id] = info
+            else:
+                missing.append(task_id)
+    if not missing:
+        return result
+    
+    task_list = ', '.join('"{}"'.format(_escape_query_value(t)) for t in missing)
+    for task in session.query(_Q_TASKS_PROJECTED.format(task_ids=task_list)).all():
+        parent = task['parent']
+        project = parent['project']
+        info = TaskInfo(
+            task_id=task['id'],
+            task_name=task['name'],
+            parent_id=parent['id'],
+            parent_name=parent['name'],
+            project_id=project['id'],
+            project_name=project['name'],
+        )
+        with _cache_lock:
+            if len(_task_cache) >= _TASK_CACHE_MAX:
+                _task_cache.pop(next(iter(_task_cache)))  # oldest first
+            _task_cache[(session_key, info.task_id)] = info
+        result[info.task_id] = info
+    return result
+
+
+# Asset-name-in-parent lookups of apply_task_id, keyed by
+# (id(session), name, parent_id) -> (time.monotonic(), fields or None).
+# Switching back and forth between tasks repeats the same lookups; entries
+# expire after _EXISTING_ASSET_TTL seconds and are dropped when an Asset is
+# published (invalidate_existing_asset_cache).
+_EXISTING_ASSET_TTL = 5.0
+_EXISTING_ASSET_CACHE_MAX = 128
+_existing_asset_cache: Dict[Tuple[int, str, str], Tuple[float, Optional[Dict[str, str]]]] = {}
+
+
+def _lookup_existing_asset(session: Any, name: str, parent_id: str) -> Optional[Dict[str, str]]:
+    """
+    id, type, parent and project names of the Asset called name under
+    parent_id, or None if there is none (cached for _EXISTING_ASSET_TTL).
+    """
+    key = (id(session), name, parent_id)
+    with _cache_lock:
+        entry = _existing_asset_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _EXISTING_ASSET_TTL:
+        return entry[1]
+    asset = _query(session, _Q_ASSET_BY_NAME_AND_PARENT, name=name, parent_id=parent_id).first()
+    fields = None
+    if asset:
+        parent = asset['parent']
+        fields = {
+            'existing_asset_id': asset['id'],
+            'existing_asset_type': asset['type']['name'],
+            'existing_parent_name': parent['name'],
+            'existing_project_name': parent['project']['name'],
+        }
+    with _cache_lock:
+        if key not in _existing_asset_cache and len(_existing_asset_cache) >= _EXISTING_ASSET_CACHE_MAX:
+            _existing_asset_cache.pop(next(iter(_existing_asset_cache)))  # oldest first
+        _existing_asset_cache[key] = (time.monotonic(), fields)
+    return fields
+
+
+def invalidate_existing_asset_cache() -> None:
+    """Forget cached asset lookups (call after creating or renaming an Asset)."""
+    with _cache_lock:
+        _existing_asset_cache.clear()
+
+
+def invalidate_task_cache(task_id: Optional[str] = None) -> None:
+    """Drop cached TaskInfo for task_id (all sessions), or everything if None."""
+    with _cache_lock:
+        if task_id is None:
+            _task_cache.clear()
+            return
+        for key in [k for k in _task_cache if k[1] == task_id]:
+            del _task_cache[key]
+
+
+@_requires_session()
 def check_task_id(
     params: Any,  # ParameterInterface
     session: Any,  # Optional[ftrack_api.Session]
-    task_info_label: Optional[Any] = None
+    task_info_label: Optional[Any] = None,
+    task_info: Optional[TaskInfo] = None
 ) -> bool:
     """
     Check and validate task_id (mimics fselector.checkTaskId).
@@ -61,18 +337,15 @@ def check_task_id(
         params: Parameter interface
         session: Ftrack session
         task_info_label: Optional label widget to update (for Qt)
+        task_info: Task already resolved by the caller (used if it matches task_Id)
     
     Returns:
         True if task_id is valid, False otherwise
     """
     _log.info("[check_task_id] Starting task_id validation")
     
-    if not session:
-        _log.warning("[check_task_id] Ftrack session is not available")
-        return False
-    
     task_id = params.get_parameter('task_Id')
-    _log.info(f"[check_task_id] Got task_id from params: {task_id}")
+    _log.debug("[check_task_id] Got task_id from params: %s", task_id)
     
     if not task_id:
         _log.warning("[check_task_id] task_id is empty")
@@ -81,38 +354,336 @@ def check_task_id(
         return False
     
     try:
-        _log.info(f"[check_task_id] Fetching Task entity: {task_id}")
-        task = session.get('Task', task_id)
-        task_name = task['name']
-        _log.info(f"[check_task_id] Task name: {task_name}")
+        if task_info is not None and task_info.task_id == task_id:
+            info = task_info
+        else:
+            _log.debug("[check_task_id] Resolving Task: %s", task_id)
+            info = _resolve_task(session, task_id)
+        task_name = info.task_name
+        _log.debug("[check_task_id] Task name: %s", task_name)
         
-        parent = task['parent']
-        parent_name = parent['name']
-        parent_id = parent['id']
-        _log.info(f"[check_task_id] Parent: {parent_name} (id: {parent_id})")
+        parent_name = info.parent_name
+        parent_id = info.parent_id
+        _log.debug("[check_task_id] Parent: %s (id: %s)", parent_name, parent_id)
         
-        project = parent['project']
-        project_name = project['name']
-        project_id = project['id']
-        _log.info(f"[check_task_id] Project: {project_name} (id: {project_id})")
+        project_name = info.project_name
+        project_id = info.project_id
+        _log.debug("[check_task_id] Project: %s (id: %s)", project_name, project_id)
         
         info_text = f"project: {project_name}    parent: {parent_name}    taskname: {task_name}"
         if task_info_label is not None:
             task_info_label.setText(info_text)
-            _log.info(f"[check_task_id] Updated task_info_label: {info_text}")
+            _log.debug("[check_task_id] Updated task_info_label: %s", info_text)
         _log.info("[check_task_id] Task validation successful")
         return True
-    except Exception as e:
-        _log.error(f"[check_task_id] Failed to validate task_id: {e}", exc_info=True)
+    except _LOOKUP_ERRORS as e:
+        _log.error(
+            "[check_task_id] Failed to validate task_id: %s", e,
+            exc_info=_log.isEnabledFor(logging.DEBUG),
+        )
         if task_info_label is not None:
             task_info_label.setText("")
         return False
 
 
+# apply_task_id dialog results, as (parameter, context key) tables. A None
+# context value leaves the parameter untouched.
+_TASK_INFO_PARAMS = (
+    ('p_task_id', 'task_id'),
+    ('task_project', 'new_project_name'),
+    ('task_parent', 'new_parent_name'),
+    ('task_name', 'new_task_name'),
+)
+_USE_EXISTING_PARAMS = (
+    ('p_project', 'existing_project_name'),
+    ('p_parent', 'existing_parent_name'),
+    ('p_asset_type', 'existing_asset_type'),
+    ('p_asset_name', 'current_asset_name'),
+    ('p_asset_id', 'existing_asset_id'),
+) + _TASK_INFO_PARAMS + (
+    ('asset_id', 'existing_asset_id'),
+    ('asset_name', 'current_asset_name'),
+    ('type', 'existing_asset_type'),
+)
+_CREATE_NEW_PARAMS = (
+    ('p_asset_id', 'empty'),
+    ('asset_id', 'empty'),
+    ('p_project', 'new_project_name'),
+    ('p_parent', 'new_parent_name'),
+    ('p_asset_type', 'current_asset_type'),
+    ('p_asset_name', 'empty'),
+) + _TASK_INFO_PARAMS + (
+    ('asset_name', 'empty'),
+    ('type', 'current_asset_type'),
+)
+_COPY_CURRENT_PARAMS = (
+    ('p_asset_id', 'empty'),
+    ('asset_id', 'empty'),
+    ('p_project', 'new_project_name'),
+    ('p_parent', 'new_parent_name'),
+    ('p_asset_type', 'current_asset_type'),
+    ('p_asset_name', 'current_asset_name'),
+) + _TASK_INFO_PARAMS + (
+    ('asset_name', 'current_asset_name'),
+    ('type', 'current_asset_type'),
+)
+# Asset not found: keep the type only if the current asset has one
+_CREATE_NEW_NOT_FOUND_PARAMS = (
+    ('p_asset_id', 'empty'),
+    ('asset_id', 'empty'),
+    ('p_project', 'new_project_name'),
+    ('p_parent', 'new_parent_name'),
+    ('p_asset_type', 'current_asset_type_or_none'),
+    ('type', 'current_asset_type_or_none'),
+    ('p_asset_name', 'empty'),
+) + _TASK_INFO_PARAMS + (
+    ('asset_name', 'empty'),
+)
+
+# Situation -> (title, message template, options). Options are
+# (button, parameter table, log suffix); Cancel (table None) is always last
+# and is also chosen for an unknown/None dialog result.
+_PARENT_CHANGE_DIALOGS = {
+    'exists': (
+        "Asset Exists",
+        "The asset '{current_asset_name}' already exists within this parent.",
+        (
+            ("Use existing", _USE_EXISTING_PARAMS, ""),
+            ("Create new", _CREATE_NEW_PARAMS, ""),
+            ("Cancel", None, ""),
+        ),
+    ),
+    'type_mismatch': (
+        "Asset Type Mismatch",
+        "The asset '{current_asset_name}' already exists within this parent, "
+        "but type is different (current: {current_asset_type}, existing: {existing_asset_type}).",
+        (
+            ("Create new", _CREATE_NEW_PARAMS, " (type mismatch)"),
+            ("Cancel", None, " (type mismatch)"),
+        ),
+    ),
+    'not_found': (
+        "Asset Not Found",
+        "The asset '{current_asset_name}' is not exists within this parent.",
+        (
+            ("Copy current", _COPY_CURRENT_PARAMS, ""),
+            ("Create new", _CREATE_NEW_NOT_FOUND_PARAMS, " (not found)"),
+            ("Cancel", None, " (not found)"),
+        ),
+    ),
+}
+# Button labels passed to show_dialog; its result indexes the options above
+_PARENT_CHANGE_BUTTONS = {
+    situation: tuple(option[0] for option in options)
+    for situation, (_title, _message, options) in _PARENT_CHANGE_DIALOGS.items()
+}
+
+
+def _updates_from_table(table, ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """{parameter: ctx[key]} for a (parameter, key) table, skipping None values."""
+    return {parm: ctx[key] for parm, key in table if ctx[key] is not None}
+
+
+def _task_info_updates(task_id: str, new_task: TaskInfo) -> Dict[str, Any]:
+    """The p_task_id/task_* parameters written by every apply_task_id path."""
+    return {
+        'p_task_id': task_id,
+        'task_project': new_task.project_name,
+        'task_parent': new_task.parent_name,
+        'task_name': new_task.task_name,
+    }
+
+
+def _resolve_asset_context(session: Any, asset_id: str):
+    """Asset with name, type and parent/project names/ids projected."""
+    return _query(session, _Q_ASSET_PROJECTED, asset_id=asset_id).one()
+
+
+@dataclass(frozen=True)
+class _AssetLookups:
+    """Server lookups _handle_parent_change needs for an initialized asset."""
+    asset_id: str
+    task_id: str
+    asset_name: str
+    asset_type: str
+    parent_changed: bool
+    # _lookup_existing_asset fields of the same-named Asset under the new
+    # parent; only looked up when parent_changed
+    existing_asset: Optional[Dict[str, str]] = None
+    existing_lookup_failed: bool = False
+
+
+def _lookup_asset_context(session: Any, new_task: TaskInfo, asset_id: str) -> Optional[_AssetLookups]:
+    """
+    Query what _handle_parent_change decides on, or None if the current
+    asset could not be resolved (apply_task_id then just applies the task info).
+    """
+    try:
+        current_asset = _resolve_asset_context(session, asset_id)
+        current_parent = current_asset['parent']
+        current_parent_id = current_parent['id']
+        current_project_id = current_parent['project']['id']
+        current_asset_name = current_asset['name']
+        current_asset_type = current_asset['type']['name']
+    except _LOOKUP_ERRORS as e:
+        _log.warning("[apply_task_id] Failed to check asset parent: %s", e)
+        return None
+    _log.debug(
+        "[apply_task_id] Current parent: %s (id: %s), project id: %s",
+        current_parent['name'], current_parent_id, current_project_id,
+    )
+    
+    # Check if parent or project changed
+    parent_changed = (current_parent_id != new_task.parent_id) or (current_project_id != new_task.project_id)
+    _log.debug(
+        "[apply_task_id] Parent changed: %s (parent: %s, project: %s)",
+        parent_changed, current_parent_id != new_task.parent_id, current_project_id != new_task.project_id,
+    )
+    existing_asset = None
+    existing_lookup_failed = False
+    if parent_changed:
+        # Check if asset with same name exists in new parent
+        try:
+            existing_asset = _lookup_existing_asset(session, current_asset_name, new_task.parent_id)
+        except _LOOKUP_ERRORS as e:
+            _log.warning("[apply_task_id] Failed to look up '%s' in new parent: %s", current_asset_name, e)
+            existing_lookup_failed = True
+    return _AssetLookups(
+        asset_id=asset_id,
+        task_id=new_task.task_id,
+        asset_name=current_asset_name,
+        asset_type=current_asset_type,
+        parent_changed=parent_changed,
+        existing_asset=existing_asset,
+        existing_lookup_failed=existing_lookup_failed,
+    )
+
+
+def _handle_parent_change(
+    show_dialog: Optional[Any],
+    task_id: str,
+    new_task: TaskInfo,
+    lookups: Optional[_AssetLookups],
+    staged: Dict[str, Any],
+) -> Optional[bool]:
+    """
+    apply_task_id for an initialized asset (p_asset_id set).
+    
+    If the new task has another parent/project, the asset parameters are
+    cleared and the user chooses how to re-target the asset. Nothing is
+    written here: updates go into staged, which apply_task_id writes once.
+    No server queries either; lookups come from _lookup_asset_context.
+    
+    Returns:
+        True to write staged, False to write nothing (cancelled), or None
+        to fall through and write staged plus the task info
+    """
+    if lookups is None:
+        return None
+    
+    # If parent and project match, just apply task info
+    if not lookups.parent_changed:
+        _log.debug("[apply_task_id] Parent/project unchanged, applying task info only")
+        return None
+    current_asset_name = lookups.asset_name
+    current_asset_type = lookups.asset_type
+    
+    # Save p_asset_name and p_asset_type to asset_name and type,
+    # and clear all p_* asset parameters (a chosen option overrides these)
+    staged.update({
+        'asset_name': current_asset_name,
+        'type': current_asset_type,
+        'p_project': "",
+        'p_parent': "",
+        'p_asset_id': "",
+        'p_asset_name': "",
+        'p_asset_type': "",
+        'asset_id': "",
+    })
+    
+    ctx = {
+        'empty': "",
+        'task_id': task_id,
+        'new_project_name': new_task.project_name,
+        'new_parent_name': new_task.parent_name,
+        'new_task_name': new_task.task_name,
+        'current_asset_name': current_asset_name,
+        'current_asset_type': current_asset_type,
+        'current_asset_type_or_none': current_asset_type or None,
+    }
+    if lookups.existing_lookup_failed:
+        return None
+    existing_asset = lookups.existing_asset
+    if existing_asset:
+        ctx.update(existing_asset)
+    
+    if not show_dialog:
+        _log.warning("[apply_task_id] show_dialog not available, cannot show dialog")
+        return None
+    
+    # Determine dialog message and options
+    if not existing_asset:
+        situation = 'not_found'
+    elif ctx['existing_asset_type'] == current_asset_type:
+        situation = 'exists'
+    else:
+        situation = 'type_mismatch'
+    title, message, options = _PARENT_CHANGE_DIALOGS[situation]
+    
+    result = show_dialog(message.format(**ctx), _PARENT_CHANGE_BUTTONS[situation], title)
+    if not isinstance(result, int) or not 0 <= result < len(options):
+        result = len(options) - 1  # Cancel
+    button, table, log_suffix = options[result]
+    _log.info("[apply_task_id] User chose '%s'%s", button, log_suffix)
+    if table is None:
+        return False
+    staged.update(_updates_from_table(table, ctx))
+    _log.info("[apply_task_id] Applied '%s' parameters%s", button, log_suffix)
+    return True
+
+
+def _handle_unparented(new_task: TaskInfo, values: Dict[str, Any], staged: Dict[str, Any]) -> None:
+    """
+    apply_task_id for an asset not created yet (no p_asset_id).
+    
+    If p_parent/p_project no longer match the new task, asset name/type are
+    kept in asset_name/type and the p_* asset parameters are cleared
+    (staged for apply_task_id's single write).
+    """
+    current_p_parent = values['p_parent']
+    current_p_project = values['p_project']
+    p_asset_name = values['p_asset_name']
+    p_asset_type = values['p_asset_type']
+    _log.debug("[apply_task_id] Current p_parent: '%s', p_project: '%s'", current_p_parent, current_p_project)
+    _log.debug("[apply_task_id] Current p_asset_name: '%s', p_asset_type: '%s'", p_asset_name, p_asset_type)
+    
+    if current_p_parent == _s(new_task.parent_name) and current_p_project == _s(new_task.project_name):
+        return
+    
+    _log.debug("[apply_task_id] p_parent or p_project changed, saving and clearing p_* parameters")
+    # Save p_asset_name and p_asset_type to asset_name and type before clearing
+    if p_asset_name:
+        staged['asset_name'] = p_asset_name
+    if p_asset_type:
+        staged['type'] = p_asset_type
+    
+    # Clear all p_* asset parameters
+    staged.update({
+        'p_project': "",
+        'p_parent': "",
+        'p_asset_id': "",
+        'p_asset_name': "",
+        'p_asset_type': "",
+        'asset_id': "",
+    })
+
+
+@_requires_session()
 def apply_task_id(
     params: Any,  # ParameterInterface
     session: Any,  # Optional[ftrack_api.Session]
-    show_dialog: Optional[Any] = None
+    show_dialog: Optional[Any] = None,
+    task_info: Optional[TaskInfo] = None
 ) -> bool:
     """
     Apply task_id to asset parameters (mimics fselector.applyTaskId).
@@ -121,275 +692,231 @@ def apply_task_id(
         params: Parameter interface
         session: Ftrack session
         show_dialog: Optional function to show dialogs (for Qt: QMessageBox)
+        task_info: Task already resolved by the caller; used only if it
+            matches the current task_Id, otherwise the task is re-queried
     
     Returns:
         True if successful, False otherwise
     """
+    return _apply_task_id(params, session, show_dialog, task_info)
+
+
+def _apply_task_id(
+    params: Any,
+    session: Any,
+    show_dialog: Optional[Any],
+    task_info: Optional[TaskInfo],
+    lookups: Optional[_AssetLookups] = None,
+) -> bool:
+    """apply_task_id; lookups made beforehand are used if they match task and asset."""
     _log.info("[apply_task_id] Starting apply_task_id")
     
-    if not session:
-        _log.warning("[apply_task_id] Ftrack session is not available")
-        return False
-    
-    task_id = params.get_parameter('task_Id')
-    _log.info(f"[apply_task_id] Got task_id from params: {task_id}")
+    # Normalized once here; everything below compares plain strings
+    values = {
+        name: _s(value) for name, value in _get_parameters(params, [
+            'task_Id', 'p_asset_id', 'p_parent', 'p_project', 'p_asset_name', 'p_asset_type',
+            'task_project', 'task_parent', 'task_name',
+        ]).items()
+    }
+    task_id = values['task_Id']
+    _log.debug("[apply_task_id] Got task_id from params: %s", task_id)
     
     if not task_id:
         _log.warning("[apply_task_id] task_id is empty, setting test='undefined'")
-        params.set_parameter('test', 'undefined')
+        _set_param(params, 'test', 'undefined')
         return False
     
-    try:
-        # Get new task and its parent
-        _log.info(f"[apply_task_id] Fetching Task entity: {task_id}")
-        new_task = session.get('Task', task_id)
-        new_task_name = new_task['name']
-        _log.info(f"[apply_task_id] New task name: {new_task_name}")
-        
-        new_parent = new_task['parent']
-        new_parent_id = new_parent['id']
-        new_parent_name = new_parent['name']
-        _log.info(f"[apply_task_id] New parent: {new_parent_name} (id: {new_parent_id})")
-        
-        new_project = new_parent['project']
-        new_project_id = new_project['id']
-        new_project_name = new_project['name']
-        _log.info(f"[apply_task_id] New project: {new_project_name} (id: {new_project_id})")
-        
-        # Helper function to set parameters
-        def _set(parm_name: str, value: Any):
-            try:
-                _log.debug(f"[apply_task_id] Setting parameter '{parm_name}' = '{value}'")
-                params.set_parameter(parm_name, value)
-            except Exception as e:
-                _log.warning(f"[apply_task_id] Failed to set '{parm_name}': {e}")
-        
-        # Check if asset is initialized (has p_asset_id)
-        current_asset_id = params.get_parameter('p_asset_id')
-        current_asset_id = str(current_asset_id).strip() if current_asset_id else None
-        _log.info(f"[apply_task_id] Current asset_id: {current_asset_id}")
-        
+    # Get new task and its parent
+    # Applying writes the task into the asset parameters, so resolve it
+    # fresh rather than from a possibly stale cache entry
+    if task_info is not None and task_info.task_id == task_id:
+        new_task = task_info
+    else:
+        _log.debug("[apply_task_id] Resolving Task: %s", task_id)
+        invalidate_task_cache(task_id)
+        try:
+            new_task = _resolve_task(session, task_id)
+        except _LOOKUP_ERRORS as e:
+            _log.error(
+                "[apply_task_id] Failed to apply task_id: %s", e,
+                exc_info=_log.isEnabledFor(logging.DEBUG),
+            )
+            return False
+    _log.debug(
+        "[apply_task_id] New task: %s, parent: %s (id: %s), project: %s (id: %s)",
+        new_task.task_name, new_task.parent_name, new_task.parent_id,
+        new_task.project_name, new_task.project_id,
+    )
+    
+    # Check if asset is initialized (has p_asset_id)
+    current_asset_id = values['p_asset_id']
+    _log.debug("[apply_task_id] Current asset_id: %s", current_asset_id)
+    
+    # All parameter changes are staged and written in one set_parameters
+    # call at the end, so a cancel or a failed lookup leaves nothing half-set
+    staged: Dict[str, Any] = {}
+    if current_asset_id:
         # If asset is initialized, check if parent or project changed
-        if current_asset_id:
-            _log.info(f"[apply_task_id] Asset is initialized, checking parent/project changes")
-            try:
-                current_asset = session.get('Asset', current_asset_id)
-                current_parent = current_asset['parent']
-                current_parent_id = current_parent['id']
-                current_parent_name = current_parent['name']
-                _log.info(f"[apply_task_id] Current parent: {current_parent_name} (id: {current_parent_id})")
-                
-                current_project = current_parent['project']
-                current_project_id = current_project['id']
-                current_project_name = current_project['name']
-                _log.info(f"[apply_task_id] Current project: {current_project_name} (id: {current_project_id})")
-                
-                # Check if parent or project changed
-                parent_changed = (current_parent_id != new_parent_id) or (current_project_id != new_project_id)
-                _log.info(f"[apply_task_id] Parent changed: {parent_changed} (parent: {current_parent_id != new_parent_id}, project: {current_project_id != new_project_id})")
-                
-                # If parent and project match, just apply task info
-                if not parent_changed:
-                    _log.info("[apply_task_id] Parent/project unchanged, applying task info only")
-                    _set('p_task_id', task_id)
-                    _set('task_project', new_project_name)
-                    _set('task_parent', new_parent_name)
-                    _set('task_name', new_task_name)
-                    _log.info("[apply_task_id] Task info applied successfully")
-                    return True
-                
-                # Parent or project changed - save p_asset_name and p_asset_type to asset_name and type,
-                # then clear all p_* parameters
-                current_asset_name = current_asset['name']
-                current_asset_type = current_asset['type']['name']
-                
-                # Save p_asset_name and p_asset_type to asset_name and type before clearing
-                _set('asset_name', current_asset_name)
-                _set('type', current_asset_type)
-                
-                # Clear all p_* asset parameters
-                _set('p_project', "")
-                _set('p_parent', "")
-                _set('p_asset_id', "")
-                _set('p_asset_name', "")
-                _set('p_asset_type', "")
-                _set('asset_id', "")
-                
-                # Check if asset with same name exists in new parent
-                existing_asset = session.query(
-                    f'Asset where name is "{current_asset_name}" and parent.id is "{new_parent_id}"'
-                ).first()
-                
-                # Determine dialog message and options
-                if existing_asset:
-                    existing_asset_type = existing_asset['type']['name']
-                    if existing_asset_type == current_asset_type:
-                        # Asset exists with same type
-                        message = f"The asset '{current_asset_name}' already exists within this parent."
-                        buttons = ("Use existing", "Create new", "Cancel")
-                        if show_dialog:
-                            result = show_dialog(message, buttons, "Asset Exists")
-                            if result == 0:  # Use existing
-                                _log.info("[apply_task_id] User chose 'Use existing'")
-                                existing_asset_id = existing_asset['id']
-                                existing_asset_entity = session.get('Asset', existing_asset_id)
-                                existing_parent = existing_asset_entity['parent']
-                                existing_project = existing_parent['project']
-                                
-                                _set('p_project', existing_project['name'])
-                                _set('p_parent', existing_parent['name'])
-                                _set('p_asset_type', existing_asset_type)
-                                _set('p_asset_name', current_asset_name)
-                                _set('p_asset_id', existing_asset_id)
-                                _set('p_task_id', task_id)
-                                _set('task_project', new_project_name)
-                                _set('task_parent', new_parent_name)
-                                _set('task_name', new_task_name)
-                                _set('asset_id', existing_asset_id)
-                                _set('asset_name', current_asset_name)
-                                _set('type', existing_asset_type)
-                                _log.info("[apply_task_id] Applied 'Use existing' parameters")
-                                return True
-                            elif result == 1:  # Create new
-                                _log.info("[apply_task_id] User chose 'Create new'")
-                                _set('p_asset_id', "")
-                                _set('asset_id', "")
-                                _set('p_project', new_project_name)
-                                _set('p_parent', new_parent_name)
-                                _set('p_asset_type', current_asset_type)
-                                _set('p_asset_name', "")
-                                _set('p_task_id', task_id)
-                                _set('task_project', new_project_name)
-                                _set('task_parent', new_parent_name)
-                                _set('task_name', new_task_name)
-                                _set('asset_name', "")
-                                _set('type', current_asset_type)
-                                _log.info("[apply_task_id] Applied 'Create new' parameters")
-                                return True
-                            else:  # Cancel
-                                _log.info("[apply_task_id] User chose 'Cancel'")
-                                return False
-                        else:
-                            _log.warning("[apply_task_id] show_dialog not available, cannot show dialog")
-                    else:
-                        # Asset exists but type is different
-                        message = f"The asset '{current_asset_name}' already exists within this parent, but type is different (current: {current_asset_type}, existing: {existing_asset_type})."
-                        buttons = ("Create new", "Cancel")
-                        if show_dialog:
-                            result = show_dialog(message, buttons, "Asset Type Mismatch")
-                            if result == 0:  # Create new
-                                _log.info("[apply_task_id] User chose 'Create new' (type mismatch)")
-                                _set('p_asset_id', "")
-                                _set('asset_id', "")
-                                _set('p_project', new_project_name)
-                                _set('p_parent', new_parent_name)
-                                _set('p_asset_type', current_asset_type)
-                                _set('p_asset_name', "")
-                                _set('p_task_id', task_id)
-                                _set('task_project', new_project_name)
-                                _set('task_parent', new_parent_name)
-                                _set('task_name', new_task_name)
-                                _set('asset_name', "")
-                                _set('type', current_asset_type)
-                                _log.info("[apply_task_id] Applied 'Create new' parameters (type mismatch)")
-                                return True
-                            else:  # Cancel
-                                _log.info("[apply_task_id] User chose 'Cancel' (type mismatch)")
-                                return False
-                        else:
-                            _log.warning("[apply_task_id] show_dialog not available, cannot show dialog")
-                else:
-                    # Asset does not exist in new parent
-                    message = f"The asset '{current_asset_name}' is not exists within this parent."
-                    buttons = ("Copy current", "Create new", "Cancel")
-                    if show_dialog:
-                        result = show_dialog(message, buttons, "Asset Not Found")
-                        if result == 0:  # Copy current
-                            _log.info("[apply_task_id] User chose 'Copy current'")
-                            _set('p_asset_id', "")
-                            _set('asset_id', "")
-                            _set('p_project', new_project_name)
-                            _set('p_parent', new_parent_name)
-                            _set('p_asset_type', current_asset_type)
-                            _set('p_asset_name', current_asset_name)
-                            _set('p_task_id', task_id)
-                            _set('task_project', new_project_name)
-                            _set('task_parent', new_parent_name)
-                            _set('task_name', new_task_name)
-                            _set('asset_name', current_asset_name)
-                            _set('type', current_asset_type)
-                            _log.info("[apply_task_id] Applied 'Copy current' parameters")
-                            return True
-                        elif result == 1:  # Create new
-                            _log.info("[apply_task_id] User chose 'Create new' (not found)")
-                            _set('p_asset_id', "")
-                            _set('asset_id', "")
-                            _set('p_project', new_project_name)
-                            _set('p_parent', new_parent_name)
-                            if current_asset_type:
-                                _set('p_asset_type', current_asset_type)
-                                _set('type', current_asset_type)
-                            _set('p_asset_name', "")
-                            _set('p_task_id', task_id)
-                            _set('task_project', new_project_name)
-                            _set('task_parent', new_parent_name)
-                            _set('task_name', new_task_name)
-                            _set('asset_name', "")
-                            _log.info("[apply_task_id] Applied 'Create new' parameters (not found)")
-                            return True
-                        else:  # Cancel
-                            _log.info("[apply_task_id] User chose 'Cancel' (not found)")
-                            return False
-                    else:
-                        _log.warning("[apply_task_id] show_dialog not available, cannot show dialog")
-                
-                # If dialog was not shown or returned None, continue to apply task info
-            except Exception as e:
-                _log.warning(f"Failed to check asset parent in applyTaskId: {e}")
-        else:
-            # If asset is not initialized, check if p_parent or p_project changed
-            _log.info("[apply_task_id] Asset is not initialized, checking p_parent/p_project changes")
-            try:
-                current_p_parent = params.get_parameter('p_parent')
-                current_p_project = params.get_parameter('p_project')
-                p_asset_name = params.get_parameter('p_asset_name')
-                p_asset_type = params.get_parameter('p_asset_type')
-                _log.info(f"[apply_task_id] Current p_parent: '{current_p_parent}', p_project: '{current_p_project}'")
-                _log.info(f"[apply_task_id] Current p_asset_name: '{p_asset_name}', p_asset_type: '{p_asset_type}'")
-                
-                if (str(current_p_parent) != str(new_parent_name)) or (str(current_p_project) != str(new_project_name)):
-                    _log.info("[apply_task_id] p_parent or p_project changed, saving and clearing p_* parameters")
-                    # Save p_asset_name and p_asset_type to asset_name and type before clearing
-                    if p_asset_name:
-                        _set('asset_name', p_asset_name)
-                    if p_asset_type:
-                        _set('type', p_asset_type)
-                    
-                    # Clear all p_* asset parameters
-                    _set('p_project', "")
-                    _set('p_parent', "")
-                    _set('p_asset_id', "")
-                    _set('p_asset_name', "")
-                    _set('p_asset_type', "")
-                    _set('asset_id', "")
-                    _log.info("[apply_task_id] Cleared all p_* parameters")
-            except Exception as e:
-                _log.warning(f"[apply_task_id] Exception while checking p_parent/p_project: {e}", exc_info=True)
-        
-        # Simple case: just apply task info
-        _log.info("[apply_task_id] Applying task info parameters")
-        _set('p_task_id', task_id)
-        _set('task_project', new_project_name)
-        _set('task_parent', new_parent_name)
-        _set('task_name', new_task_name)
-        _log.info("[apply_task_id] Task info applied successfully")
-        return True
-        
-    except Exception as e:
-        _log.error(f"[apply_task_id] Failed to apply task_id: {e}", exc_info=True)
-        return False
+        _log.debug("[apply_task_id] Asset is initialized, checking parent/project changes")
+        if lookups is None or (lookups.asset_id, lookups.task_id) != (current_asset_id, task_id):
+            lookups = _lookup_asset_context(session, new_task, current_asset_id)
+        result = _handle_parent_change(show_dialog, task_id, new_task, lookups, staged)
+        if result is False:
+            return False
+        if result:
+            _set_parameters(params, staged)
+            return True
+        # If dialog was not shown or returned None, continue to apply task info
+    else:
+        # If asset is not initialized, check if p_parent or p_project changed
+        _log.debug("[apply_task_id] Asset is not initialized, checking p_parent/p_project changes")
+        _handle_unparented(new_task, values, staged)
+    
+    # Simple case: just apply task info
+    _log.debug("[apply_task_id] Applying task info parameters")
+    staged.update(_changed_only(_task_info_updates(task_id, new_task), values))
+    if staged:
+        _set_parameters(params, staged)
+    _log.info("[apply_task_id] Task info applied successfully")
+    return True
+
+
+@_requires_session()
+def check_and_apply_task_id(
+    params: Any,  # ParameterInterface
+    session: Any,  # Optional[ftrack_api.Session]
+    task_info_label: Optional[Any] = None,
+    show_dialog: Optional[Any] = None
+) -> bool:
+    """
+    check_task_id followed by apply_task_id, querying the Task once.
+    
+    Args:
+        params: Parameter interface
+        session: Ftrack session
+        task_info_label: Optional label widget to update (for Qt)
+        show_dialog: Optional function to show dialogs (for Qt: QMessageBox)
+    
+    Returns:
+        Result of apply_task_id
+    """
+    task_info = None
+    task_id = params.get_parameter('task_Id')
+    if task_id:
+        # Fresh, as apply_task_id would resolve it
+        invalidate_task_cache(task_id)
+        try:
+            task_info = _resolve_task(session, task_id)
+        except _LOOKUP_ERRORS as e:
+            _log.warning("[check_and_apply_task_id] Failed to resolve Task '%s': %s", task_id, e)
+    check_task_id(params, session, task_info_label, task_info)
+    return apply_task_id(params, session, show_dialog, task_info)
+
+
+# apply_task_id_async runs its queries on this single thread with a session
+# of its own: ftrack sessions are not thread-safe, so the caller's session
+# stays on the UI thread. _worker_session is only touched by that thread.
+_executor: Optional[ThreadPoolExecutor] = None
+_worker_session: Any = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ftrack-selector")
+    return _executor
+
+
+def _get_worker_session() -> Any:
+    """The selector worker's session, created on first use (worker thread only)."""
+    global _worker_session
+    if _worker_session is None:
+        try:
+            from ...common.session_factory import create_worker_session
+        except ImportError:
+            raise RuntimeError("session_factory is not available for a worker session")
+        _worker_session = create_worker_session()
+        if _worker_session is None:
+            raise RuntimeError("Could not create a worker ftrack session")
+    return _worker_session
+
+
+def apply_task_id_async(
+    params: Any,  # ParameterInterface
+    session: Any,  # Optional[ftrack_api.Session]
+    on_done: Callable[[bool], None],
+    dispatch: Callable[[Callable[[], None]], None],
+    task_info_label: Optional[Any] = None,
+    show_dialog: Optional[Any] = None
+) -> Optional[Future]:
+    """
+    check_and_apply_task_id with the ftrack queries run off the calling thread.
+    
+    The Task and, for an initialized asset, its current parent and the
+    same-named Asset under the new parent are looked up on a worker thread
+    with the worker's own session (create_worker_session); session itself
+    is never used there. The label update, dialogs and parameter writes
+    touch the DCC UI, so they and on_done are handed to dispatch, which
+    must run them on the UI thread (Qt: a queued signal, see qt_bridge).
+    
+    Args:
+        params: Parameter interface (read on the calling thread)
+        session: Ftrack session of the UI thread
+        on_done: Called with the apply_task_id result on the UI thread
+        dispatch: Runs a callable on the UI thread; called from the worker
+        task_info_label: Optional label widget to update (for Qt)
+        show_dialog: Optional function to show dialogs (for Qt: QMessageBox)
+    
+    Returns:
+        Future of the lookups, or None if nothing had to be queried (no
+        session or empty task_Id; on_done has been called already)
+    """
+    if not session:
+        _log.warning("[apply_task_id_async] Ftrack session is not available")
+        on_done(False)
+        return None
+    values = _get_parameters(params, ['task_Id', 'p_asset_id'])
+    task_id = _s(values['task_Id'])
+    if not task_id:
+        on_done(check_and_apply_task_id(params, session, task_info_label, show_dialog))
+        return None
+    asset_id = _s(values['p_asset_id'])
+    
+    def _fetch() -> Tuple[TaskInfo, Optional[_AssetLookups]]:
+        worker_session = _get_worker_session()
+        # Fresh, as apply_task_id would resolve it
+        invalidate_task_cache(task_id)
+        task_info = _resolve_task(worker_session, task_id)
+        lookups = _lookup_asset_context(worker_session, task_info, asset_id) if asset_id else None
+        return task_info, lookups
+    
+    def _apply(task_info: TaskInfo, lookups: Optional[_AssetLookups]) -> None:
+        check_task_id(params, session, task_info_label, task_info)
+        on_done(_apply_task_id(params, session, show_dialog, task_info, lookups))
+    
+    def _failed() -> None:
+        if task_info_label is not None:
+            task_info_label.setText("")
+        on_done(False)
+    
+    def _fetched(future: Future) -> None:
+        try:
+            task_info, lookups = future.result()
+        except Exception as e:
+            _log.error(
+                "[apply_task_id_async] Failed to resolve Task '%s': %s", task_id, e,
+                exc_info=_log.isEnabledFor(logging.DEBUG),
+            )
+            dispatch(_failed)
+            return
+        dispatch(lambda: _apply(task_info, lookups))
+    
+    future = _get_executor().submit(_fetch)
+    future.add_done_callback(_fetched)
+    return future
 
 
+@_requires_session()
 def apply_asset_params(
     params: Any,  # ParameterInterface
     session: Any,  # Optional[ftrack_api.Session]
@@ -408,56 +935,57 @@ def apply_asset_params(
     """
     _log.info("[apply_asset_params] Starting apply_asset_params")
     
-    if not session:
-        _log.warning("[apply_asset_params] Ftrack session is not available")
-        return False
-    
     try:
-        asset_id = params.get_parameter('asset_id')
-        asset_name = params.get_parameter('asset_name')
-        cur_type = params.get_parameter('type')
-        task_id = params.get_parameter('task_Id')
-        _log.info(f"[apply_asset_params] Read parameters: asset_id='{asset_id}', asset_name='{asset_name}', type='{cur_type}', task_id='{task_id}'")
+        values = _get_parameters(params, ['asset_id', 'asset_name', 'type', 'task_Id'])
+        asset_id = values['asset_id']
+        asset_name = values['asset_name']
+        cur_type = values['type']
+        task_id = values['task_Id']
+        _log.debug(
+            "[apply_asset_params] Read parameters: asset_id='%s', asset_name='%s', type='%s', task_id='%s'",
+            asset_id, asset_name, cur_type, task_id,
+        )
     except Exception as e:
-        _log.error(f"[apply_asset_params] Failed to read parameters: {e}", exc_info=True)
+        _log.error(
+            "[apply_asset_params] Failed to read parameters: %s", e,
+            exc_info=_log.isEnabledFor(logging.DEBUG),
+        )
         return False
     
-    def _set(parm_name: str, value: Any):
-        try:
-            _log.debug(f"[apply_asset_params] Setting parameter '{parm_name}' = '{value}'")
-            params.set_parameter(parm_name, value)
-        except Exception as e:
-            _log.warning(f"[apply_asset_params] Failed to set '{parm_name}': {e}")
-    
     if asset_id:
-        _log.info(f"[apply_asset_params] Asset ID provided, querying Asset: {asset_id}")
+        _log.debug("[apply_asset_params] Asset ID provided, querying Asset: %s", asset_id)
         try:
-            asset = session.query(f"Asset where id is '{asset_id}'").one()
-            _log.info(f"[apply_asset_params] Found asset: {asset['name']}")
+            asset = _query(session, _Q_ASSET_PROJECTED, asset_id=asset_id).one()
+            _log.debug("[apply_asset_params] Found asset: %s", asset['name'])
             
             parent = asset['parent']
             parent_name = parent['name']
             parent_id = parent['id']
-            _log.info(f"[apply_asset_params] Asset parent: {parent_name} (id: {parent_id})")
+            _log.debug("[apply_asset_params] Asset parent: %s (id: %s)", parent_name, parent_id)
             
             project = parent['project']
             project_name = project['name']
             project_id = project['id']
-            _log.info(f"[apply_asset_params] Asset project: {project_name} (id: {project_id})")
+            _log.debug("[apply_asset_params] Asset project: %s (id: %s)", project_name, project_id)
             
             asset_type_name = cur_type if cur_type else asset['type']['name']
             asset_name_final = asset_name if asset_name else asset['name']
-            _log.info(f"[apply_asset_params] Using asset_type='{asset_type_name}', asset_name='{asset_name_final}'")
+            _log.debug("[apply_asset_params] Using asset_type='%s', asset_name='%s'", asset_type_name, asset_name_final)
             
-            _set('p_project', project_name)
-            _set('p_parent', parent_name)
-            _set('p_asset_type', asset_type_name)
-            _set('p_asset_name', asset_name_final)
-            _set('p_asset_id', asset_id)
+            _set_parameters(params, {
+                'p_project': project_name,
+                'p_parent': parent_name,
+                'p_asset_type': asset_type_name,
+                'p_asset_name': asset_name_final,
+                'p_asset_id': asset_id,
+            })
             _log.info("[apply_asset_params] Asset parameters applied successfully (from asset_id)")
             return True
-        except Exception as e:
-            _log.error(f"[apply_asset_params] Failed to resolve Asset '{asset_id}': {e}", exc_info=True)
+        except _LOOKUP_ERRORS as e:
+            _log.error(
+                "[apply_asset_params] Failed to resolve Asset '%s': %s", asset_id, e,
+                exc_info=_log.isEnabledFor(logging.DEBUG),
+            )
             return False
     
     if not task_id:
@@ -466,31 +994,35 @@ def apply_asset_params(
             task_info_label.setText('undefined')
         return False
     
-    _log.info(f"[apply_asset_params] No asset_id, using task_id to get parent/project: {task_id}")
+    _log.debug("[apply_asset_params] No asset_id, using task_id to get parent/project: %s", task_id)
     try:
-        task = session.get('Task', task_id)
-        parent = task['parent']
-        parent_name = parent['name']
-        parent_id = parent['id']
-        _log.info(f"[apply_asset_params] Task parent: {parent_name} (id: {parent_id})")
+        info = _resolve_task(session, task_id)
+        parent_name = info.parent_name
+        parent_id = info.parent_id
+        _log.debug("[apply_asset_params] Task parent: %s (id: %s)", parent_name, parent_id)
         
-        project = parent['project']
-        project_name = project['name']
-        project_id = project['id']
-        _log.info(f"[apply_asset_params] Task project: {project_name} (id: {project_id})")
+        project_name = info.project_name
+        project_id = info.project_id
+        _log.debug("[apply_asset_params] Task project: %s (id: %s)", project_name, project_id)
         
-        _set('p_project', project_name)
-        _set('p_parent', parent_name)
-        _set('p_asset_type', cur_type)
-        _set('p_asset_name', asset_name)
-        _set('p_asset_id', "")
+        _set_parameters(params, {
+            'p_project': project_name,
+            'p_parent': parent_name,
+            'p_asset_type': cur_type,
+            'p_asset_name': asset_name,
+            'p_asset_id': "",
+        })
         _log.info("[apply_asset_params] Asset parameters applied successfully (from task_id)")
         return True
-    except Exception as e:
-        _log.error(f"[apply_asset_params] Failed to apply asset parameters: {e}", exc_info=True)
+    except _LOOKUP_ERRORS as e:
+        _log.error(
+            "[apply_asset_params] Failed to apply asset parameters: %s", e,
+            exc_info=_log.isEnabledFor(logging.DEBUG),
+        )
         return False
 
 
+@_requires_session(lambda: ({}, {}))
 def get_assets_list(
     session: Any,  # Optional[ftrack_api.Session]
     task_id: str
@@ -505,48 +1037,50 @@ def get_assets_list(
     Returns:
         Tuple of (unique_version dict {name: id}, unique_types dict {name: type})
     """
-    _log.info(f"[get_assets_list] Starting get_assets_list for task_id: {task_id}")
-    
-    if not session:
-        _log.warning("[get_assets_list] Ftrack session is not available")
-        return {}, {}
+    _log.info("[get_assets_list] Starting get_assets_list for task_id: %s", task_id)
     
     try:
-        _log.info(f"[get_assets_list] Fetching Task entity: {task_id}")
-        task = session.get('Task', task_id)
-        parent_id = task['parent_id']
-        _log.info(f"[get_assets_list] Task parent_id: {parent_id}")
+        _log.debug("[get_assets_list] Resolving Task: %s", task_id)
+        parent_id = _resolve_task(session, task_id).parent_id
+        _log.debug("[get_assets_list] Task parent_id: %s", parent_id)
         
-        _log.info(f"[get_assets_list] Querying assets for parent.id='{parent_id}'")
-        assets = session.query(f'Asset where parent.id is "{parent_id}"').all()
-        _log.info(f"[get_assets_list] Found {len(assets)} assets")
+        _log.debug("[get_assets_list] Querying assets for parent.id='%s'", parent_id)
+        assets = _query(session, _Q_ASSETS_BY_PARENT, parent_id=parent_id).all()
+        _log.debug("[get_assets_list] Found %s assets", len(assets))
         
+        # First asset per name wins; attributes are projected, so nothing is
+        # fetched lazily here or while sorting below
         unique_version = {}
         unique_types = {}
-        seen = set()
-        sorted_assets = sorted(assets, key=lambda asset_entity: asset_entity['name'].lower()) if assets else []
-        
-        for asset in sorted_assets:
+        for asset in assets:
             try:
                 asset_name = asset['name']
-                asset_id = asset['id']
+                if asset_name in unique_version:
+                    continue
                 asset_type = asset['type']['name']
-                if asset_name not in seen:
-                    unique_version[asset_name] = asset_id
-                    unique_types[asset_name] = asset_type
-                    seen.add(asset_name)
-                    _log.debug(f"[get_assets_list] Added asset: {asset_name} (id: {asset_id}, type: {asset_type})")
-            except Exception as e:
-                _log.warning(f"[get_assets_list] Failed to process asset: {e}")
+                unique_version[asset_name] = asset['id']
+                unique_types[asset_name] = asset_type
+            except _LOOKUP_ERRORS as e:
+                _log.warning("[get_assets_list] Failed to process asset: %s", e)
                 continue
         
-        _log.info(f"[get_assets_list] Returning {len(unique_version)} unique assets")
+        # Sort once by name (case-insensitive); the stable sort keeps query
+        # order between names differing only in case, as before
+        names = sorted(unique_version, key=str.lower)
+        unique_version = {name: unique_version[name] for name in names}
+        unique_types = {name: unique_types[name] for name in names}
+        
+        _log.debug("[get_assets_list] Returning %s unique assets", len(unique_version))
         return unique_version, unique_types
-    except Exception as e:
-        _log.error(f"[get_assets_list] Failed to get assets list: {e}", exc_info=True)
+    except _LOOKUP_ERRORS as e:
+        _log.error(
+            "[get_assets_list] Failed to get assets list: %s", e,
+            exc_info=_log.isEnabledFor(logging.DEBUG),
+        )
         return {}, {}
 
 
+@_requires_session()
 def apply_name(
     params: Any,  # ParameterInterface
     session: Any,  # Optional[ftrack_api.Session]
@@ -568,39 +1102,41 @@ def apply_name(
         True if successful, False otherwise
     """
     _log.info("[apply_name] Starting apply_name")
-    _log.info(f"[apply_name] assets_menu_ids: {assets_menu_ids}, assets_menu_index: {assets_menu_index}")
-    
-    if not session:
-        _log.warning("[apply_name] Ftrack session is not available")
-        return False
+    _log.debug("[apply_name] assets_menu_ids: %s, assets_menu_index: %s", assets_menu_ids, assets_menu_index)
     
     # Check if assets menu is available (from get_ex)
     if assets_menu_ids and assets_menu_index is not None and assets_menu_index >= 0:
-        _log.info(f"[apply_name] Using assets menu, index: {assets_menu_index}")
+        _log.debug("[apply_name] Using assets menu, index: %s", assets_menu_index)
         if assets_menu_index < len(assets_menu_ids):
             asset_id = assets_menu_ids[assets_menu_index]
-            _log.info(f"[apply_name] Selected asset_id from menu: {asset_id}")
+            _log.debug("[apply_name] Selected asset_id from menu: %s", asset_id)
             try:
-                asset = session.get('Asset', asset_id)
+                asset = _query(session, _Q_ASSET_NAME_TYPE, asset_id=asset_id).first()
                 asset_name = asset['name']
                 asset_type = asset['type']['name']
-                _log.info(f"[apply_name] Found asset: {asset_name} (type: {asset_type})")
+                _log.debug("[apply_name] Found asset: %s (type: %s)", asset_name, asset_type)
                 
                 if asset_name != 'new_asset':
-                    params.set_parameter('asset_id', asset_id)
-                    params.set_parameter('asset_name', asset_name)
-                    params.set_parameter('type', asset_type)
+                    _set_parameters(params, {
+                        'asset_id': asset_id,
+                        'asset_name': asset_name,
+                        'type': asset_type,
+                    })
                     _log.info("[apply_name] Asset parameters set successfully (from menu)")
                     return True
-            except Exception as e:
-                _log.error(f"[apply_name] Failed to load asset: {e}", exc_info=True)
+            except _LOOKUP_ERRORS as e:
+                _log.error(
+                    "[apply_name] Failed to load asset: %s", e,
+                    exc_info=_log.isEnabledFor(logging.DEBUG),
+                )
                 return False
     
     # Check if name field is available (from cr_new)
-    name = params.get_parameter('name')
+    values = _get_parameters(params, ['name', 'ass_type', 'task_Id'])
+    name = values['name']
     if name:
-        ass_type = params.get_parameter('ass_type')
-        task_id = params.get_parameter('task_Id')
+        ass_type = values['ass_type']
+        task_id = values['task_Id']
         
         if not task_id:
             if show_message:
@@ -610,21 +1146,21 @@ def apply_name(
         # Check if asset with same name already exists
         exists = False
         try:
-            task = session.get('Task', task_id)
-            parent_id = task['parent_id']
-            existing_asset = session.query(
-                f'Asset where name is "{name}" and parent.id is "{parent_id}"'
-            ).first()
-            if existing_asset is not None:
-                exists = True
-            else:
-                existing_build = session.query(
-                    f'AssetBuild where name is "{name}" and parent.id is "{parent_id}"'
-                ).first()
-                if existing_build is not None:
-                    exists = True
-        except Exception as e:
-            _log.warning(f"Failed to validate existing name '{name}': {e}")
+            parent_id = _resolve_task(session, task_id).parent_id
+            # Asset is not a TypedContext, so both lookups go out in one batched call
+            responses = session.call([
+                {
+                    'action': 'query',
+                    'expression': _expr(
+                        _Q_ID_BY_NAME_AND_PARENT,
+                        entity_type=entity_type, name=name, parent_id=parent_id,
+                    ),
+                }
+                for entity_type in ('Asset', 'AssetBuild')
+            ])
+            exists = any(response.get('data') for response in responses)
+        except _LOOKUP_ERRORS as e:
+            _log.warning("Failed to validate existing name '%s': %s", name, e)
         
         if exists:
             if show_message:
@@ -632,10 +1168,8 @@ def apply_name(
             return False
         
         # Clear asset_id and set name/type
-        _log.info(f"[apply_name] Setting asset parameters: asset_id='', asset_name='{name}', type='{ass_type}'")
-        params.set_parameter('asset_id', "")
-        params.set_parameter('asset_name', name)
-        params.set_parameter('type', ass_type)
+        _log.debug("[apply_name] Setting asset parameters: asset_id='', asset_name='%s', type='%s'", name, ass_type)
+        _set_parameters(params, {'asset_id': "", 'asset_name': name, 'type': ass_type})
         _log.info("[apply_name] Asset parameters set successfully (from name/type)")
         return True
     
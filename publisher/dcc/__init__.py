@@ -6,51 +6,71 @@ the DCC-specific parameter interface to the core ParameterInterface protocol.
 
 Available bridges:
 - houdini: HoudiniParameterInterface, build_job_from_hda, publish_callback
-- maya: MayaDCCBridge (TODO)
-- qt_bridge: QtBridge for standalone Qt UI
+- maya: MayaDCCBridge
+- qt_bridge: apply_task_id_qt, apply_name_qt, ... for standalone Qt UI
+
+Bridges are imported lazily (PEP 562 __getattr__): only the bridge that is
+actually requested gets loaded, e.g. `from publisher.dcc import
+build_job_from_hda` imports hou but never Maya or Qt.
 """
 
-# Lazy imports - bridges are only loaded when needed
-__all__ = [
+from importlib import import_module
+
+# Public name -> submodule that provides it
+_LAZY_EXPORTS = {
+    # Houdini bridge - only available inside Houdini
+    'HoudiniParameterInterface': '.houdini',
+    'build_job_from_hda': '.houdini',
+    'publish_callback': '.houdini',
+    'publish_dry_run_callback': '.houdini',
+    'get_target_node': '.houdini',
+    'get_transfer_target_location_menu_items': '.houdini',
+    # Maya bridge - only available inside Maya
+    'MayaDCCBridge': '.maya',
+    # Qt bridge for standalone UI
+    'apply_task_id_qt': '.qt_bridge',
+    'check_and_apply_task_id_qt': '.qt_bridge',
+    'apply_task_id_async_qt': '.qt_bridge',
+    'apply_name_qt': '.qt_bridge',
+}
+
+__all__ = list(_LAZY_EXPORTS) + [
     'get_houdini_bridge',
     'get_maya_bridge',
     'get_qt_bridge',
 ]
 
 
-def get_houdini_bridge():
-    """Get Houdini bridge (only available inside Houdini)."""
-    from .houdini import (
-        HoudiniParameterInterface,
-        build_job_from_hda,
-        publish_callback,
-        publish_dry_run_callback,
-        get_target_node,
-        get_transfer_target_location_menu_items,
-    )
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache: subsequent lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def _bridge(module_name: str) -> dict:
     return {
-        'HoudiniParameterInterface': HoudiniParameterInterface,
-        'build_job_from_hda': build_job_from_hda,
-        'publish_callback': publish_callback,
-        'publish_dry_run_callback': publish_dry_run_callback,
-        'get_target_node': get_target_node,
-        'get_transfer_target_location_menu_items': get_transfer_target_location_menu_items,
+        name: __getattr__(name)
+        for name, module in _LAZY_EXPORTS.items() if module == module_name
     }
 
 
+def get_houdini_bridge():
+    """Get Houdini bridge as {name: object} (kept for existing callers)."""
+    return _bridge('.houdini')
+
+
 def get_maya_bridge():
-    """Get Maya bridge (only available inside Maya)."""
-    from .maya import MayaDCCBridge
-    return {
-        'MayaDCCBridge': MayaDCCBridge,
-    }
+    """Get Maya bridge as {name: object} (kept for existing callers)."""
+    return _bridge('.maya')
 
 
 def get_qt_bridge():
-    """Get Qt bridge for standalone UI."""
-    from .qt_bridge import apply_task_id_qt, apply_name_qt, apply_type_qt
-    return {
-        'apply_task_id_qt': apply_task_id_qt,
-        'apply_name_qt': apply_name_qt,
-        'apply_type_qt': apply_type_qt,
-    }
+    """Get Qt bridge as {name: object} (kept for existing callers)."""
+    return _bridge('.qt_bridge')
@@ -11,11 +11,24 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import re
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 _log = logging.getLogger(__name__)
 
+# Sequence indicators in one pass: %d, %0.., $F, @, and '#' only as frame
+# padding (surrounded by '.'/'_' or at the end)
+_SEQ_RE = re.compile(r'%d|%0|\$F|@|[._]#+[._]|#$')
+# Extensions typically written as sequences (.bgeo.sc / .geo.sc end in .sc)
+_SEQ_EXT_RE = re.compile(r'\.(vdb|exr|jpe?g|bgeo|tiff?|png|geo|sc|abc|ass)$', re.IGNORECASE)
+# name.0001.ext -> ('name', '0001', 'ext')
+_FRAME_SUFFIX_RE = re.compile(r'^(.+?)\.(\d+)\.([^.]+)$')
+# Houdini frame variable with optional padding ($F, $F4)
+_DOLLAR_F_RE = re.compile(r'\$F\d*')
+
 # Houdini imports (only available in Houdini)
 try:
     import hou
@@ -69,6 +82,28 @@ def get_transfer_target_location_menu_items() -> List[str]:
     return result
 
 
+# Parameters with these prefixes live on the target node (see get_target_node)
+_TARGET_PREFIXES = ('p_', 'task_')
+
+# parmTemplateType -> reader, for types not read with parm.eval() (a Menu
+# reads as its token, not its index). Built on first use, as hou enums are
+# only there inside Houdini.
+_PARM_EVALERS: Optional[Dict[Any, Callable[[Any], Any]]] = None
+
+
+def _get_parm_evalers() -> Dict[Any, Callable[[Any], Any]]:
+    global _PARM_EVALERS
+    if _PARM_EVALERS is None:
+        _PARM_EVALERS = {hou.parmTemplateType.Menu: hou.Parm.evalAsString} if HOUDINI_AVAILABLE else {}
+    return _PARM_EVALERS
+
+
+def _eval_parm(parm) -> Any:
+    """Value of parm as get_parameter returns it (see _PARM_EVALERS)."""
+    evaler = _get_parm_evalers().get(parm.parmTemplate().type())
+    return parm.eval() if evaler is None else evaler(parm)
+
+
 class HoudiniParameterInterface:
     """Parameter interface for Houdini HDA nodes.
     
@@ -93,7 +128,7 @@ class HoudiniParameterInterface:
         
         # Determine which node to read from
         # p_* and task_* parameters go to target_node
-        if name.startswith('p_') or name.startswith('task_'):
+        if name.startswith(_TARGET_PREFIXES):
             read_node = self.target_node
         else:
             read_node = self.node
@@ -102,34 +137,41 @@ class HoudiniParameterInterface:
             parm = read_node.parm(name)
             if parm is None:
                 return None
-            
-            # Get value based on parameter type
-            parm_template = parm.parmTemplate()
-            parm_type = parm_template.type()
-            
-            if parm_type == hou.parmTemplateType.String:
-                return parm.eval()
-            elif parm_type == hou.parmTemplateType.Int:
-                return parm.eval()
-            elif parm_type == hou.parmTemplateType.Toggle:
-                return parm.eval()
-            elif parm_type == hou.parmTemplateType.Float:
-                return parm.eval()
-            elif parm_type == hou.parmTemplateType.Menu:
-                return parm.evalAsString()
-            else:
-                return parm.eval()
+            return _eval_parm(parm)
         except Exception as e:
             _log.warning(f"Failed to read parameter '{name}': {e}")
             return None
     
+    def get_parameters(self, names: List[str]) -> Dict[str, Any]:
+        """Get several parameter values; each node's parms are looked up once."""
+        if not HOUDINI_AVAILABLE:
+            return dict.fromkeys(names)
+        
+        parms_by_node = {}
+        result = {}
+        for name in names:
+            if name.startswith(_TARGET_PREFIXES):
+                read_node = self.target_node
+            else:
+                read_node = self.node
+            try:
+                node_parms = parms_by_node.get(read_node)
+                if node_parms is None:
+                    node_parms = parms_by_node[read_node] = {p.name(): p for p in read_node.parms()}
+                parm = node_parms.get(name)
+                result[name] = None if parm is None else _eval_parm(parm)
+            except Exception as e:
+                _log.warning(f"Failed to read parameter '{name}': {e}")
+                result[name] = None
+        return result
+    
     def set_parameter(self, name: str, value: Any) -> None:
         """Set parameter value on node."""
         if not HOUDINI_AVAILABLE:
             return
         
         # Determine which node to write to
-        if name.startswith('p_') or name.startswith('task_'):
+        if name.startswith(_TARGET_PREFIXES):
             write_node = self.target_node
         else:
             write_node = self.node
@@ -142,6 +184,29 @@ class HoudiniParameterInterface:
         except Exception as e:
             _log.warning(f"Failed to set parameter '{name}': {e}")
     
+    def set_parameters(self, updates: Dict[str, Any]) -> None:
+        """Set several parameters with one setParms call per node, as one undo step."""
+        if not HOUDINI_AVAILABLE:
+            return
+        
+        # Route like set_parameter; unknown names are skipped (setParms would raise)
+        per_node = {}
+        for name, value in updates.items():
+            if name.startswith(_TARGET_PREFIXES):
+                write_node = self.target_node
+            else:
+                write_node = self.node
+            if write_node.parm(name) is not None:
+                per_node.setdefault(write_node, {})[name] = value
+        
+        with hou.undos.group("Set ftrack selector parameters"):
+            for write_node, parms in per_node.items():
+                try:
+                    write_node.setParms(parms)
+                    _log.debug(f"Set parameters {list(parms)} on {write_node.path()}")
+                except Exception as e:
+                    _log.warning(f"Failed to set parameters {list(parms)}: {e}")
+    
     def show_message(self, message: str, severity: str = "info") -> None:
         """Show message using Houdini UI."""
         if not HOUDINI_AVAILABLE:
@@ -191,9 +256,6 @@ def save_scene_archive() -> str:
     if not HOUDINI_AVAILABLE:
         raise RuntimeError("Houdini is not available")
     
-    import time
-    import os
-    
     original_file = hou.hipFile.path()
     
     # Build archive path: $HIP/tmp/P_YYYYMMDDHHMMSS_filename.hip
@@ -221,11 +283,25 @@ def save_scene_archive() -> str:
     return archive_path
 
 
+def _hda_instances_with_parm(parm_name: str):
+    """Yield instances of every loaded HDA whose nodes have parm_name.
+    
+    Only asset definitions are visited (tens, not every node in the scene),
+    and each type is tested on its first instance: the parm comes from the
+    definition, so all instances of a type either have it or not.
+    """
+    for hda_file in hou.hda.loadedFiles():
+        for definition in hou.hda.definitionsInFile(hda_file):
+            instances = definition.nodeType().instances()
+            if instances and instances[0].parm(parm_name) is not None:
+                yield from instances
+
+
 def find_linked_component_ids() -> List[str]:
     """Find all __ftrack_used_CompId values in the scene.
     
-    Scans all nodes for the __ftrack_used_CompId attribute and returns
-    a list of component IDs that are linked in this scene.
+    Reads the __ftrack_used_CompId parameter of the input HDAs that define
+    it and returns the component IDs linked in this scene.
     """
     if not HOUDINI_AVAILABLE:
         return []
@@ -234,26 +310,20 @@ def find_linked_component_ids() -> List[str]:
     attrib_name = "__ftrack_used_CompId"
     
     try:
-        # Search all nodes in scene
-        for node in hou.node('/').allSubChildren():
+        for node in _hda_instances_with_parm(attrib_name):
             try:
                 parm = node.parm(attrib_name)
                 if parm:
-                    value = parm.eval()
-                    if value and str(value).strip():
-                        linked_ids.append(str(value).strip())
+                    value = str(parm.eval() or '').strip()
+                    if value:
+                        linked_ids.append(value)
             except Exception:
                 continue
     except Exception as e:
         _log.warning(f"[HoudiniBridge] Error scanning for linked components: {e}")
     
     # Remove duplicates while preserving order
-    seen = set()
-    unique_ids = []
-    for cid in linked_ids:
-        if cid not in seen:
-            seen.add(cid)
-            unique_ids.append(cid)
+    unique_ids = list(dict.fromkeys(linked_ids))
     
     _log.debug(f"[HoudiniBridge] Found {len(unique_ids)} linked component IDs")
     return unique_ids
@@ -294,16 +364,23 @@ def build_job_from_hda(node) -> PublishJob:
     if target_node != node:
         _log.info(f"[HoudiniBridge] Using target_node: {target_node.path()}")
     
+    # Resolve every parm of each node in one call; the component loop below
+    # reads components x metadata names, each a node.parm() lookup otherwise
+    node_parms = {p.name(): p for p in node.parms()}
+    if target_node == node:
+        target_parms = node_parms
+    else:
+        target_parms = {p.name(): p for p in target_node.parms()}
+    
     # Helper to read from correct node
     def get_parm(name: str):
         """Get parameter value, using target_node for p_* params."""
         # p_* and task_* parameters are on target_node
-        if name.startswith('p_') or name.startswith('task_'):
-            read_node = target_node
+        if name.startswith(_TARGET_PREFIXES):
+            parm = target_parms.get(name)
         else:
-            read_node = node
+            parm = node_parms.get(name)
         
-        parm = read_node.parm(name)
         if parm is None:
             return None
         
@@ -328,7 +405,6 @@ def build_job_from_hda(node) -> PublishJob:
         try:
             linked_ids = find_linked_component_ids()
             if linked_ids:
-                import json
                 snapshot_metadata['ilink'] = json.dumps(linked_ids)
                 _log.debug(f"[HoudiniBridge] Snapshot ilink: {len(linked_ids)} components")
         except Exception as e:
@@ -366,7 +442,7 @@ def build_job_from_hda(node) -> PublishJob:
     # 3. File components (always read, use_custom only controls UI visibility)
     # Get component count from multiparm
     # In HDA, 'components' is a TabbedMultiparmBlock folder
-    components_parm = node.parm('components')
+    components_parm = node_parms.get('components')
     component_count = components_parm.eval() if components_parm else 0
     _log.debug(f"[HoudiniBridge] Processing {component_count} file components")
     
@@ -379,7 +455,7 @@ def build_job_from_hda(node) -> PublishJob:
             # Raw path (unexpanded) - for sequence fallback when $F4→0001 but files start at 1128
             file_path_raw = None
             try:
-                fp_parm = node.parm(f'file_path{i}')
+                fp_parm = node_parms.get(f'file_path{i}')
                 if fp_parm and hasattr(fp_parm, 'rawValue'):
                     file_path_raw = fp_parm.rawValue() or ''
             except Exception:
@@ -398,7 +474,7 @@ def build_job_from_hda(node) -> PublishJob:
             
             # Collect metadata from nested multiparm
             metadata = {'dcc': 'houdini'}
-            meta_count_parm = node.parm(f'meta_count{i}')
+            meta_count_parm = node_parms.get(f'meta_count{i}')
             meta_count = meta_count_parm.eval() if meta_count_parm else 0
             for m in range(1, meta_count + 1):
                 key = get_parm(f'key{i}_{m}') or ''
@@ -504,17 +580,25 @@ def _is_sequence_pattern(path: str) -> bool:
     """Check if path contains sequence pattern."""
     if not path:
         return False
-    
-    indicators = ['%d', '%0', '$F', '@', '#']
-    for indicator in indicators:
-        if indicator in path:
-            if indicator == '#':
-                import re
-                if re.search(r'[._]#+[._]', path) or path.endswith('#'):
-                    return True
-            else:
-                return True
-    return False
+    return _SEQ_RE.search(path) is not None
+
+
+# fileseq, imported on the first sequence check (None until then, or if missing)
+_fileseq = None
+_fileseq_missing = False
+
+
+def _get_fileseq():
+    """The fileseq module, or None (warned about once) if it is not installed."""
+    global _fileseq, _fileseq_missing
+    if _fileseq is None and not _fileseq_missing:
+        try:
+            import fileseq
+            _fileseq = fileseq
+        except ImportError:
+            _fileseq_missing = True
+            _log.warning("[HoudiniBridge] fileseq not available, sequence detection disabled")
+    return _fileseq
 
 
 def _detect_sequence_on_disk(
@@ -539,18 +623,8 @@ def _detect_sequence_on_disk(
     if not file_path:
         return None
     
-    import os
-    import re
-    
-    # Extensions that are typically sequences
-    seq_extensions = ['.vdb', '.exr', '.jpg', '.jpeg', '.bgeo', '.tiff', '.tif', 
-                      '.png', '.bgeo.sc', '.geo', '.geo.sc', '.sc', '.abc', '.ass']
-    
     # Check if file has a sequence-like extension
-    file_lower = file_path.lower()
-    is_seq_ext = any(file_lower.endswith(ext) for ext in seq_extensions)
-    
-    if not is_seq_ext:
+    if not _SEQ_EXT_RE.search(file_path):
         return None
     
     def _seq_to_result(seq) -> Dict[str, Any]:
@@ -586,9 +660,11 @@ def _detect_sequence_on_disk(
             'length': seq_length,
         }
     
+    fs = _get_fileseq()
+    if fs is None:
+        return None
+    
     try:
-        import fileseq as fs
-        
         # 1. Try findSequenceOnDisk with evaluated path (works when file exists)
         seq = fs.findSequenceOnDisk(file_path)
         
@@ -605,11 +681,11 @@ def _detect_sequence_on_disk(
         pattern_path = None
         if raw_path and '$F' in raw_path:
             # Convert X:/path/maya_part.$F4.sc → X:/path/maya_part.@.sc
-            pattern_path = re.sub(r'\$F\d*', '@', raw_path)
+            pattern_path = _DOLLAR_F_RE.sub('@', raw_path)
             pattern_path = pattern_path.replace('\\', '/')
         else:
             # From evaluated path maya_part.0001.sc → maya_part.@.sc
-            match = re.match(r'^(.+?)\.(\d+)\.([^.]+)$', basename)
+            match = _FRAME_SUFFIX_RE.match(basename)
             if match:
                 prefix, _frame, ext = match.groups()
                 pattern_path = os.path.join(dirname, f"{prefix}.@{ext}")
@@ -625,9 +701,6 @@ def _detect_sequence_on_disk(
         
         return None
         
-    except ImportError:
-        _log.warning("[HoudiniBridge] fileseq not available, sequence detection disabled")
-        return None
     except Exception as e:
         _log.debug(f"[HoudiniBridge] Not a sequence or error: {e}")
         return None
@@ -876,7 +949,6 @@ def _update_node_after_publish(node, result: PublishResult):
         
         # Log to node if log parameter exists
         if node.parm('log'):
-            import time
             timestamp = time.strftime("%H:%M:%S")
             log_msg = (
                 f"[{timestamp}] Published v{result.asset_version_number}: "
@@ -485,21 +485,16 @@ def find_linked_component_ids() -> List[str]:
         
         for node in nodes_with_attr:
             try:
-                value = cmds.getAttr(f"{node}.{attrib_name}")
-                if value and str(value).strip():
-                    linked_ids.append(str(value).strip())
+                value = str(cmds.getAttr(f"{node}.{attrib_name}") or '').strip()
+                if value:
+                    linked_ids.append(value)
             except Exception:
                 continue
     except Exception as e:
         _log.warning(f"[MayaBridge] Error scanning for linked components: {e}")
     
     # Remove duplicates while preserving order
-    seen = set()
-    unique_ids = []
-    for cid in linked_ids:
-        if cid not in seen:
-            seen.add(cid)
-            unique_ids.append(cid)
+    unique_ids = list(dict.fromkeys(linked_ids))
     
     _log.debug(f"[MayaBridge] Found {len(unique_ids)} linked component IDs")
     return unique_ids
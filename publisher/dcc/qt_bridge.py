@@ -6,19 +6,24 @@ Adapts Qt widget parameter interface to core ParameterInterface protocol.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 try:
-    from PySide2 import QtWidgets
+    from PySide2 import QtCore, QtWidgets
+    Signal = QtCore.Signal
 except ImportError:
     try:
-        from PySide6 import QtWidgets
+        from PySide6 import QtCore, QtWidgets
+        Signal = QtCore.Signal
     except ImportError:
-        from PyQt5 import QtWidgets
+        from PyQt5 import QtCore, QtWidgets
+        Signal = QtCore.pyqtSignal
 
 from ..core.selector import (
     check_task_id as core_check_task_id,
     apply_task_id as core_apply_task_id,
+    apply_task_id_async as core_apply_task_id_async,
+    check_and_apply_task_id as core_check_and_apply_task_id,
     apply_asset_params as core_apply_asset_params,
     get_assets_list as core_get_assets_list,
     apply_name as core_apply_name,
@@ -36,10 +41,27 @@ class QtParameterInterface:
         """Get parameter value from widget."""
         return self.widget.get_parameter(name)
     
+    def get_parameters(self, names: List[str]) -> Dict[str, Any]:
+        """Get several parameter values from widget."""
+        get_parameters = getattr(self.widget, 'get_parameters', None)
+        if get_parameters is not None:
+            return get_parameters(names)
+        return {name: self.widget.get_parameter(name) for name in names}
+    
     def set_parameter(self, name: str, value: Any) -> None:
         """Set parameter value on widget."""
         self.widget.set_parameter(name, value)
     
+    def set_parameters(self, updates: Dict[str, Any]) -> None:
+        """Set several parameters with widget repaints held until the last one."""
+        widget = self.widget
+        widget.setUpdatesEnabled(False)
+        try:
+            for name, value in updates.items():
+                widget.set_parameter(name, value)
+        finally:
+            widget.setUpdatesEnabled(True)
+    
     def show_message(self, message: str, severity: str = "info") -> None:
         """Show message using QMessageBox."""
         if severity == "warning":
@@ -64,10 +86,36 @@ def check_task_id_qt(widget, session, task_info_label):
     return result
 
 
-def apply_task_id_qt(widget, session):
-    """Qt wrapper for apply_task_id."""
-    _log.info("[qt_bridge] apply_task_id_qt called")
-    interface = QtParameterInterface(widget)
+class _UiDispatcher(QtCore.QObject):
+    """Runs callables posted from worker threads on the thread that created it."""
+    
+    _posted = Signal(object)
+    
+    def __init__(self):
+        super().__init__()
+        # Queued: emitted from a worker, _run executes in this object's thread
+        self._posted.connect(self._run, QtCore.Qt.QueuedConnection)
+    
+    def _run(self, fn):
+        fn()
+    
+    def __call__(self, fn):
+        self._posted.emit(fn)
+
+
+_ui_dispatcher: Optional[_UiDispatcher] = None
+
+
+def _get_ui_dispatcher() -> _UiDispatcher:
+    """Dispatcher living on the UI thread (first call must come from it)."""
+    global _ui_dispatcher
+    if _ui_dispatcher is None:
+        _ui_dispatcher = _UiDispatcher()
+    return _ui_dispatcher
+
+
+def _make_show_dialog(widget):
+    """Build a show_dialog callback for apply_task_id parented to widget."""
     
     def show_dialog(message: str, buttons: tuple, title: str = "Info"):
         """Show dialog using QMessageBox with custom buttons.
@@ -111,11 +159,48 @@ def apply_task_id_qt(widget, session):
         _log.warning(f"[qt_bridge] No button was clicked")
         return None
     
-    result = core_apply_task_id(interface, session, show_dialog)
+    return show_dialog
+
+
+def apply_task_id_qt(widget, session):
+    """Qt wrapper for apply_task_id."""
+    _log.info("[qt_bridge] apply_task_id_qt called")
+    interface = QtParameterInterface(widget)
+    result = core_apply_task_id(interface, session, _make_show_dialog(widget))
     _log.info(f"[qt_bridge] apply_task_id_qt result: {result}")
     return result
 
 
+def check_and_apply_task_id_qt(widget, session, task_info_label):
+    """Qt wrapper for check_and_apply_task_id."""
+    _log.info("[qt_bridge] check_and_apply_task_id_qt called")
+    interface = QtParameterInterface(widget)
+    result = core_check_and_apply_task_id(
+        interface, session, task_info_label, _make_show_dialog(widget)
+    )
+    _log.info(f"[qt_bridge] check_and_apply_task_id_qt result: {result}")
+    return result
+
+
+def apply_task_id_async_qt(widget, session, task_info_label, on_done=None):
+    """
+    Qt wrapper for apply_task_id_async (check_and_apply_task_id_qt without
+    blocking the UI on ftrack queries); on_done(result) runs on the UI thread.
+    """
+    _log.info("[qt_bridge] apply_task_id_async_qt called")
+    interface = QtParameterInterface(widget)
+    
+    def _done(result):
+        _log.info(f"[qt_bridge] apply_task_id_async_qt result: {result}")
+        if on_done is not None:
+            on_done(result)
+    
+    return core_apply_task_id_async(
+        interface, session, _done, _get_ui_dispatcher(),
+        task_info_label, _make_show_dialog(widget),
+    )
+
+
 def apply_asset_params_qt(widget, session, task_info_label):
     """Qt wrapper for apply_asset_params."""
     _log.info("[qt_bridge] apply_asset_params_qt called")
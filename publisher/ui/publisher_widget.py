@@ -99,7 +99,7 @@ except ImportError as e:
 try:
     from ftrack_inout.publisher.dcc.qt_bridge import (
         check_task_id_qt,
-        apply_task_id_qt,
+        apply_task_id_async_qt,
         apply_asset_params_qt,
         get_assets_list_qt,
         apply_name_qt,
@@ -667,9 +667,9 @@ class PublisherWidget(QtWidgets.QWidget):
         self.task_id_edit = QtWidgets.QLineEdit()
         self.task_id_edit.setPlaceholderText("Paste task_id from browser")
         task_id_layout.addWidget(self.task_id_edit)
-        apply_task_btn = QtWidgets.QPushButton("apply to asset")
-        apply_task_btn.clicked.connect(self._on_apply_task_clicked)
-        task_id_layout.addWidget(apply_task_btn)
+        self.apply_task_btn = QtWidgets.QPushButton("apply to asset")
+        self.apply_task_btn.clicked.connect(self._on_apply_task_clicked)
+        task_id_layout.addWidget(self.apply_task_btn)
         content_layout.addLayout(task_id_layout)
         
         # Buttons: get_from_env, get_from_scene, check taskid
@@ -995,8 +995,15 @@ class PublisherWidget(QtWidgets.QWidget):
         """Apply task_id to asset parameters (uses core logic through Qt bridge)."""
         _log.info("[publisher_widget] _on_apply_task_clicked called")
         if CORE_LOGIC_AVAILABLE:
-            _log.info("[publisher_widget] Using core logic (apply_task_id_qt)")
-            apply_task_id_qt(self, self._session)
+            # Task/asset queries run on a worker; the label, dialogs and
+            # parameters are updated back on the UI thread. The button stays
+            # disabled until then so clicks cannot queue up applies.
+            _log.info("[publisher_widget] Using core logic (apply_task_id_async_qt)")
+            self.apply_task_btn.setEnabled(False)
+            apply_task_id_async_qt(
+                self, self._session, self.task_info_label,
+                lambda result: self.apply_task_btn.setEnabled(True),
+            )
         else:
             _log.warning("[publisher_widget] Core logic not available, using fallback")
             # Fallback to direct implementation
@@ -1407,10 +1414,10 @@ class PublisherWidget(QtWidgets.QWidget):
             )
     
     # Parameter access methods (matching HDA parameter names)
-    def get_parameter(self, name: str) -> Any:
-        """Get parameter value by name (matching HDA parameter names)."""
+    def _parameter_map(self) -> Dict[str, Any]:
+        """Current values of all top-level parameters (matching HDA parameter names)."""
         # Map UI widgets to parameter names
-        param_map = {
+        return {
             'task_Id': self.task_id_edit.text(),
             'p_task_id': self.task_id_edit.text(),
             'use_custom': 1 if self.use_custom_checkbox.isChecked() else 0,
@@ -1431,7 +1438,9 @@ class PublisherWidget(QtWidgets.QWidget):
             'comment': self.comment_edit.toPlainText() if hasattr(self, 'comment_edit') else '',
             'transfer_target_location': (self.transfer_target_location_combo.currentData() or "") if getattr(self, "transfer_target_location_combo", None) else "",
         }
-        
+    
+    def get_parameter(self, name: str) -> Any:
+        """Get parameter value by name (matching HDA parameter names)."""
         # Component parameters
         if name.startswith('comp_name') or name.startswith('file_path') or name.startswith('export') or \
            name.startswith('meta_count') or name.startswith('key') or name.startswith('value'):
@@ -1443,7 +1452,20 @@ class PublisherWidget(QtWidgets.QWidget):
                     return comp_data[name]
             return ''
         
-        return param_map.get(name, '')
+        return self._parameter_map().get(name, '')
+    
+    def get_parameters(self, names: List[str]) -> Dict[str, Any]:
+        """Get several parameter values at once.
+        
+        Top-level parameters are read from the widgets in a single pass
+        (get_parameter rebuilds that map on every call); component
+        parameters fall back to get_parameter.
+        """
+        param_map = self._parameter_map()
+        return {
+            name: param_map[name] if name in param_map else self.get_parameter(name)
+            for name in names
+        }
     
     def set_parameter(self, name: str, value: Any):
         """Set parameter value by name (matching HDA parameter names)."""